@@ -1,6 +1,7 @@
 """Script to generate sample loan policy PDF documents."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from reportlab.lib.enums import TA_CENTER
@@ -14,31 +15,44 @@ SCRIPT_DIR = Path(__file__).parent
 
 logger = logging.getLogger(__name__)
 
+# Styles and spacers shared by all documents, built once instead of per document
+STYLES = getSampleStyleSheet()
+SPACER_SMALL = Spacer(1, 0.2 * inch)
+SPACER_MEDIUM = Spacer(1, 0.3 * inch)
+SPACER_LARGE = Spacer(1, 0.5 * inch)
+
+
+def _make_title_style(color: str) -> ParagraphStyle:
+    """Create the document title style in the given color."""
+    return ParagraphStyle(
+        "CustomTitle",
+        parent=STYLES["Heading1"],
+        fontSize=24,
+        textColor=color,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+    )
+
+
+LOAN_POLICY_TITLE_STYLE = _make_title_style("darkblue")
+BEST_PRACTICES_TITLE_STYLE = _make_title_style("darkgreen")
+
 
 def create_loan_policy_v1() -> None:
     """Create internal loan policy document."""
     pdf_path = SCRIPT_DIR / "loan_policy_v1.pdf"
     doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-    styles = getSampleStyleSheet()
     story = []
 
     # Title
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor="darkblue",
-        spaceAfter=30,
-        alignment=TA_CENTER,
-    )
-    story.append(Paragraph("Internal Loan Approval Policy", title_style))
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("Version 1.0 - Effective Date: January 2024", styles["Normal"]))
-    story.append(Spacer(1, 0.5 * inch))
+    story.append(Paragraph("Internal Loan Approval Policy", LOAN_POLICY_TITLE_STYLE))
+    story.append(SPACER_MEDIUM)
+    story.append(Paragraph("Version 1.0 - Effective Date: January 2024", STYLES["Normal"]))
+    story.append(SPACER_LARGE)
 
     # Section 1
-    story.append(Paragraph("1. Credit Score Requirements", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("1. Credit Score Requirements", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     All loan applicants must meet minimum credit score requirements based on loan type:
@@ -51,12 +65,12 @@ def create_loan_policy_v1() -> None:
     Applicants with credit scores below these thresholds require executive approval and must provide
     additional documentation including proof of income stability and collateral where applicable.
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 2
-    story.append(Paragraph("2. Debt-to-Income Ratio Standards", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("2. Debt-to-Income Ratio Standards", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     The maximum allowable debt-to-income (DTI) ratio is 43% for all loan types. This includes:
@@ -70,12 +84,12 @@ def create_loan_policy_v1() -> None:
     • Larger down payment (minimum 20% for home loans)
     • Co-borrower with qualifying income
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 3
-    story.append(Paragraph("3. Employment and Income Verification", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("3. Employment and Income Verification", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     All applicants must demonstrate stable income through:
@@ -90,12 +104,12 @@ def create_loan_policy_v1() -> None:
     Income must be verifiable and sufficient to support the proposed loan payment while maintaining
     the maximum DTI ratio of 43%.
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 4
-    story.append(Paragraph("4. Adverse Credit Events", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("4. Adverse Credit Events", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     The following waiting periods apply after adverse credit events:
@@ -110,12 +124,12 @@ def create_loan_policy_v1() -> None:
     Exceptions may be granted for documented extenuating circumstances (medical emergency, job loss
     due to economic conditions) with executive approval.
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 5
-    story.append(Paragraph("5. Loan-to-Value Ratios", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("5. Loan-to-Value Ratios", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Maximum loan-to-value (LTV) ratios by loan type:
@@ -131,12 +145,12 @@ def create_loan_policy_v1() -> None:
     • Lower DTI ratio (under 35%)
     • Significant liquid reserves (6+ months of payments)
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 6
-    story.append(Paragraph("6. Reserve Requirements", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("6. Reserve Requirements", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Minimum reserve requirements after closing:
@@ -149,12 +163,12 @@ def create_loan_policy_v1() -> None:
     Reserves must be in liquid, readily accessible accounts (checking, savings, money market).
     Retirement accounts may be considered at 60% of value.
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 7
-    story.append(Paragraph("7. Risk-Based Pricing", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("7. Risk-Based Pricing", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Interest rates are determined by risk assessment:
@@ -169,7 +183,7 @@ def create_loan_policy_v1() -> None:
     • +0.25% for cash-out refinance
     • -0.25% for automatic payment enrollment
     """
-    story.append(Paragraph(content, styles["BodyText"]))
+    story.append(Paragraph(content, STYLES["BodyText"]))
 
     doc.build(story)
     logger.info("Generated: %s", pdf_path)
@@ -179,26 +193,17 @@ def create_best_practices() -> None:
     """Create industry best practices document."""
     pdf_path = SCRIPT_DIR / "best_practices.pdf"
     doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-    styles = getSampleStyleSheet()
     story = []
 
     # Title
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor="darkgreen",
-        spaceAfter=30,
-        alignment=TA_CENTER,
-    )
-    story.append(Paragraph("Loan Underwriting Best Practices", title_style))
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("Industry Standards and Guidelines - 2024", styles["Normal"]))
-    story.append(Spacer(1, 0.5 * inch))
+    story.append(Paragraph("Loan Underwriting Best Practices", BEST_PRACTICES_TITLE_STYLE))
+    story.append(SPACER_MEDIUM)
+    story.append(Paragraph("Industry Standards and Guidelines - 2024", STYLES["Normal"]))
+    story.append(SPACER_LARGE)
 
     # Introduction
-    story.append(Paragraph("Introduction", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("Introduction", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     This document outlines industry best practices for loan underwriting, based on guidelines from
@@ -206,12 +211,12 @@ def create_best_practices() -> None:
     followed to ensure prudent lending decisions while maintaining compliance with regulatory
     requirements.
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 1
-    story.append(Paragraph("1. Ability to Repay", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("1. Ability to Repay", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     The fundamental principle of responsible lending is ensuring the borrower's ability to repay:
@@ -227,12 +232,12 @@ def create_best_practices() -> None:
     • Back-end DTI (total debt ratio): Maximum 36-43%
     • Residual income: Minimum varies by family size and location
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 2
-    story.append(Paragraph("2. Credit History Evaluation", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("2. Credit History Evaluation", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Comprehensive credit review beyond the credit score:
@@ -251,12 +256,12 @@ def create_best_practices() -> None:
     • Collections or charge-offs
     • Inconsistent payment patterns
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 3
-    story.append(Paragraph("3. Property Valuation Standards", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("3. Property Valuation Standards", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     For secured loans, proper collateral valuation is essential:
@@ -273,12 +278,12 @@ def create_best_practices() -> None:
     • Consider property type and marketability
     • Factor in necessary repairs or defects
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 4
-    story.append(Paragraph("4. Risk Mitigation Strategies", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("4. Risk Mitigation Strategies", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Implement appropriate risk mitigation measures:
@@ -296,12 +301,12 @@ def create_best_practices() -> None:
     • Stable long-term employment
     • Significant equity in other properties
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 5
-    story.append(Paragraph("5. Documentation Requirements", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("5. Documentation Requirements", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Maintain complete documentation for each loan:
@@ -320,12 +325,12 @@ def create_best_practices() -> None:
     • From reliable third-party sources
     • Verified for accuracy and authenticity
     """
-    story.append(Paragraph(content, styles["BodyText"]))
-    story.append(Spacer(1, 0.3 * inch))
+    story.append(Paragraph(content, STYLES["BodyText"]))
+    story.append(SPACER_MEDIUM)
 
     # Section 6
-    story.append(Paragraph("6. Fair Lending Compliance", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story.append(Paragraph("6. Fair Lending Compliance", STYLES["Heading2"]))
+    story.append(SPACER_SMALL)
 
     content = """
     Ensure compliance with fair lending regulations:
@@ -344,7 +349,7 @@ def create_best_practices() -> None:
     • Disability
     • Age (for certain loan types)
     """
-    story.append(Paragraph(content, styles["BodyText"]))
+    story.append(Paragraph(content, STYLES["BodyText"]))
 
     doc.build(story)
     logger.info("Generated: %s", pdf_path)
@@ -353,6 +358,10 @@ def create_best_practices() -> None:
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     logger.info("Generating loan policy PDF documents...")
-    create_loan_policy_v1()
-    create_best_practices()
+    # Each document is laid out independently, so build them in parallel processes
+    builders = (create_loan_policy_v1, create_best_practices)
+    with ProcessPoolExecutor(max_workers=len(builders)) as executor:
+        futures = [executor.submit(builder) for builder in builders]
+        for future in futures:
+            future.result()
     logger.info("PDF generation complete!")
@@ -1,15 +1,27 @@
 """Loan approval agent implementation with LangGraph."""
 
+import asyncio
+import hashlib
+import itertools
+import json
+import os
 import ssl
+import sys
+import tempfile
 import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, TypedDict
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
 
+import anyio.to_thread
 import httpx
 import mlflow
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
-from langgraph.graph import END, StateGraph
 from pydantic import SecretStr
 
 if TYPE_CHECKING:
@@ -21,6 +33,7 @@ from shared.models.loan import (
     DecisionType,
     LoanDecision,
     LoanOutcome,
+    LoanPurpose,
     LoanRequest,
 )
 from shared.monitoring import (
@@ -29,31 +42,107 @@ from shared.monitoring import (
     get_logger,
     setup_mlflow_langchain_autologging,
 )
-from shared.utils import PDFLoader, PermissionChecker, SecurityContext
+from shared.utils import PDFLoader, Permission, PermissionChecker, SecurityContext
 
 logger = get_logger(__name__)
 
+# Interest rate is the base rate plus a risk premium proportional to the 0-100 risk score
+BASE_INTEREST_RATE = 3.5
+MAX_RISK_PREMIUM = 10.0
+INTEREST_RATE_TABLE: tuple[float, ...] = tuple(
+    round(BASE_INTEREST_RATE + (risk_score / 100) * MAX_RISK_PREMIUM, 4)
+    for risk_score in range(101)
+)
+INTEREST_RATE_DECIMALS: tuple[Decimal, ...] = tuple(
+    Decimal(str(rate)) for rate in INTEREST_RATE_TABLE
+)
+
+# Loans backed by collateral; the fast lane requires their loan-to-value ratio
+_SECURED_PURPOSES = frozenset(
+    {LoanPurpose.HOME_PURCHASE, LoanPurpose.HOME_REFINANCE, LoanPurpose.AUTO}
+)
+
+
+def _amortized_payment(loan_amount: float, monthly_rate: float, term_months: int) -> float:
+    """Calculate the fixed monthly payment of a fully amortizing loan."""
+    if monthly_rate == 0.0:
+        # The annuity formula divides by zero for interest-free loans
+        return loan_amount / term_months
+    compound = (1.0 + monthly_rate) ** term_months
+    return loan_amount * monthly_rate * compound / (compound - 1.0)
+
+
+if sys.platform == "win32":
+
+    @contextmanager
+    def _exclusive_lock(_lock_file: IO[str]) -> Iterator[None]:
+        """No-op lock: flock is POSIX-only.
+
+        Workers may then extract the PDFs concurrently, which is safe because the policy
+        cache file is replaced atomically.
+        """
+        yield
+
+else:
+    import fcntl
+
+    @contextmanager
+    def _exclusive_lock(lock_file: IO[str]) -> Iterator[None]:
+        """Hold an exclusive flock on an open file."""
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """HTTP client shared by every agent in the process.
+
+    Loading the system certificate store takes tens of milliseconds, and a shared client
+    keeps its pooled LLM connections alive across agent instances.
+    """
+    # Use the system's certificate store, which includes corporate proxy CA certs
+    return httpx.Client(
+        verify=ssl.create_default_context(),
+        timeout=60.0,
+        # Keep as many idle connections as may be in flight, so concurrent requests
+        # reuse TLS sessions instead of reconnecting (httpx keeps only 20 by default)
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+    )
 
-class AgentState(TypedDict, total=False):
-    """Type definition for agent state."""
+
+@dataclass(slots=True)
+class AgentState:
+    """Typed workflow state passed between LangGraph nodes."""
 
     request: LoanRequest
-    validation_passed: bool
-    validation_errors: list[str]
-    eligible: bool
-    rejection_reason: str
-    need_additional_info: bool
-    additional_info_description: str
-    dti_ratio: float
-    risk_score: int
-    policy_compliant: bool
-    policy_notes: str
-    decision: LoanDecision
+    trace_id: str = ""
+    validation_passed: bool = False
+    validation_errors: list[str] = field(default_factory=list)
+    eligible: bool = False
+    rejection_reason: str = ""
+    need_additional_info: bool = False
+    additional_info_description: str = ""
+    dti_ratio: float = 0.0
+    risk_score: int = 50
+    policy_compliant: bool = False
+    policy_notes: str = ""
+    decision: LoanDecision | None = None
 
 
 class LoanApprovalAgent:
     """AI agent for loan approval decisions."""
 
+    # Permissions needed to read an application and record a decision on it
+    REQUIRED_PERMISSIONS = (
+        Permission.READ_PII,
+        Permission.READ_FINANCIAL,
+        Permission.READ_CREDIT,
+        Permission.WRITE_DECISION,
+    )
+
     def __init__(
         self,
         security_context: SecurityContext | None = None,
@@ -112,6 +201,9 @@ class LoanApprovalAgent:
         self.metrics_tracker = metrics_tracker or MetricsTracker(
             experiment_name=config.mlflow_experiment_name
         )
+        # One MLflow run per worker process; requests are logged to it as metric steps
+        self.metrics_tracker.start_worker_run(run_name=f"loan-worker-{os.getpid()}")
+        self._request_counter = itertools.count()
 
         # Enable MLflow LangChain autologging if configured
         if self.config.enable_llm_logging:
@@ -135,47 +227,82 @@ class LoanApprovalAgent:
             [self.llm_callback] if self.llm_callback else None
         )
 
-        # Create HTTP client with system SSL certificates for corporate proxies
-        # This uses the system's certificate store which includes corporate CA certs
-        http_client = httpx.Client(
-            verify=ssl.create_default_context(),
-            timeout=60.0,
-        )
-
         # Initialize LLM based on configuration (OpenAI or Azure OpenAI)
-        if config.use_azure_openai:
-            self.llm: ChatOpenAI | AzureChatOpenAI = AzureChatOpenAI(
-                azure_deployment=config.azure_openai_deployment,
-                azure_endpoint=config.azure_openai_endpoint,
-                api_key=SecretStr(config.azure_openai_api_key or ""),
-                api_version=config.azure_openai_api_version,
-                temperature=config.openai_temperature,
-                callbacks=callbacks,
-                http_client=http_client,
-            )
-            logger.info(f"Using Azure OpenAI with deployment: {config.azure_openai_deployment}")
-        else:
-            self.llm = ChatOpenAI(
-                model=config.openai_model,
-                temperature=config.openai_temperature,
-                api_key=SecretStr(config.openai_api_key),
-                callbacks=callbacks,
-                http_client=http_client,
-            )
-            logger.info(f"Using OpenAI with model: {config.openai_model}")
+        model = config.azure_openai_deployment if config.use_azure_openai else config.openai_model
+        self.llm = self._create_llm(model or "", callbacks)
+
+        # Optional cheaper model that screens applications before the main model reviews them
+        screening_llm = None
+        if config.policy_check_screening_model:
+            screening_llm = self._create_llm(config.policy_check_screening_model, callbacks)
 
         # Load policy documents
         self.policy_content = self._load_policies()
+        if not self.policy_content and self.config.require_policies:
+            error_msg = (
+                f"No policy documents could be loaded from {self.config.policies_directory}. "
+                "Set REQUIRE_POLICIES=false to run with risk-only decisions."
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
 
         # Initialize tools
         self.risk_calculator = RiskCalculator(config)
-        self.policy_checker = PolicyChecker(self.llm, self.policy_content)
+        self.policy_checker = PolicyChecker(
+            self.llm,
+            self.policy_content,
+            cache_size=config.policy_check_cache_size,
+            json_mode=config.policy_check_json_mode,
+            screening_llm=screening_llm,
+            screening_min_confidence=config.policy_check_screening_min_confidence,
+            metrics_tracker=self.metrics_tracker,
+        )
 
-        # Build workflow graph
-        self.workflow = self._build_workflow()
+        # Bind the tool methods once so workflow nodes make a single call per request
+        self._calculate_risk_score = self.risk_calculator.calculate_risk_score
+        self._check_compliance = self.policy_checker.check_compliance
 
         logger.info(f"Loan approval agent initialized (version {config.agent_version})")
 
+    def _create_llm(
+        self, model: str, callbacks: "list[BaseCallbackHandler] | None"
+    ) -> ChatOpenAI | AzureChatOpenAI:
+        """Create a chat model client for the configured provider.
+
+        Args:
+            model: OpenAI model name, or Azure OpenAI deployment name
+            callbacks: Callback handlers attached to every call
+
+        Returns:
+            Chat model sharing the process-wide HTTP client
+
+        """
+        # Reuse the process-wide HTTP client with system SSL certificates for corporate proxies
+        http_client = _shared_http_client()
+
+        if self.config.use_azure_openai:
+            logger.info(f"Using Azure OpenAI with deployment: {model}")
+            return AzureChatOpenAI(
+                azure_deployment=model,
+                azure_endpoint=self.config.azure_openai_endpoint,
+                api_key=SecretStr(self.config.azure_openai_api_key or ""),
+                api_version=self.config.azure_openai_api_version,
+                temperature=self.config.openai_temperature,
+                max_completion_tokens=self.config.openai_max_tokens,
+                callbacks=callbacks,
+                http_client=http_client,
+            )
+
+        logger.info(f"Using OpenAI with model: {model}")
+        return ChatOpenAI(
+            model=model,
+            temperature=self.config.openai_temperature,
+            max_completion_tokens=self.config.openai_max_tokens,
+            api_key=SecretStr(self.config.openai_api_key),
+            callbacks=callbacks,
+            http_client=http_client,
+        )
+
     def health_check(self) -> dict[str, Any]:
         """Perform health check including LLM connectivity test.
 
@@ -188,7 +315,8 @@ class LoanApprovalAgent:
             "llm_configured": False,
             "llm_responsive": False,
             "policies_loaded": bool(self.policy_content),
-            "workflow_ready": self.workflow is not None,
+            # Report without building: the cached workflow only exists once it was used
+            "workflow_ready": "workflow" in vars(self),
             "error": None,
         }
 
@@ -218,19 +346,94 @@ class LoanApprovalAgent:
 
         return health_status
 
+    @property
+    def _policies_cache_path(self) -> Path:
+        """Path of the extracted policy text cache stored next to the PDFs."""
+        return Path(self.config.policies_directory) / ".policies_cache.json"
+
+    def _policies_digest(self) -> str:
+        """Hash the (name, mtime, size) of every policy PDF to detect changes."""
+        pdf_stats = sorted(
+            (p.name, p.stat().st_mtime_ns, p.stat().st_size)
+            for p in Path(self.config.policies_directory).glob("*.pdf")
+        )
+        return hashlib.sha1(repr(pdf_stats).encode(), usedforsecurity=False).hexdigest()
+
+    def _read_policies_cache(self, digest: str) -> str | None:
+        """Return the cached policy text if it was extracted from the same PDFs."""
+        try:
+            with self._policies_cache_path.open(encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("digest") == digest:
+                return str(cache["content"])
+        except (OSError, ValueError, KeyError):
+            logger.debug("Policy cache missing or invalid")
+        return None
+
+    def _write_policies_cache(self, digest: str, content: str) -> None:
+        """Atomically write the policy cache so concurrent readers never see partial files."""
+        cache_path = self._policies_cache_path
+        try:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"digest": digest, "content": content}, f)
+                Path(tmp_name).replace(cache_path)
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write policy cache: {e}")
+
+    @contextmanager
+    def _policies_lock(self) -> Iterator[None]:
+        """Serialize PDF extraction across worker processes sharing the policies directory."""
+        lock_path = Path(self.config.policies_directory) / ".policies_cache.lock"
+        try:
+            lock_file = lock_path.open("a")
+        except OSError:
+            # Read-only or missing directory: extract without coordination
+            yield
+            return
+
+        with lock_file, _exclusive_lock(lock_file):
+            yield
+
     def _load_policies(self) -> str:
-        """Load policy documents from PDFs."""
+        """Load policy documents from PDFs, reusing the cached text when unchanged."""
         try:
             logger.info(f"Loading policies from {self.config.policies_directory}")
-            content = PDFLoader.load_directory(self.config.policies_directory)
+            digest = self._policies_digest()
+
+            content = self._read_policies_cache(digest)
+            if content is None:
+                with self._policies_lock():
+                    # Another worker may have extracted the PDFs while we waited
+                    content = self._read_policies_cache(digest)
+                    if content is None:
+                        content = PDFLoader.load_directory(self.config.policies_directory)
+                        self._write_policies_cache(digest, content)
+            else:
+                logger.info("Policy documents loaded from cache")
+
             logger.info("Policy documents loaded successfully")
             return content
         except Exception:
             logger.exception("Failed to load policy documents")
             return ""
 
+    @cached_property
+    def workflow(self) -> Any:
+        """Compiled workflow graph, built on first use and reused afterwards."""
+        return self._build_workflow()
+
     def _build_workflow(self) -> Any:
         """Build the LangGraph workflow for loan approval."""
+        # Imported here so processes that never build the workflow skip langgraph's import cost
+        from langgraph.graph import END, StateGraph  # noqa: PLC0415
+
         workflow = StateGraph(AgentState)
 
         # Add nodes
@@ -262,7 +465,7 @@ class LoanApprovalAgent:
         """Validate input data."""
         with mlflow.start_span(name="validate_input") as span:
             logger.info("Validating input data")
-            request = state["request"]
+            request = state.request
 
             # Log span attributes
             span.set_attributes(
@@ -273,11 +476,8 @@ class LoanApprovalAgent:
                 }
             )
 
-            # Security check
-            self.security_context.require_all_permissions(*list(self.security_context.permissions))
-
-            state["validation_passed"] = True
-            state["validation_errors"] = []
+            state.validation_passed = True
+            state.validation_errors = []
 
             span.set_attribute("validation_passed", value=True)
             return state
@@ -286,7 +486,7 @@ class LoanApprovalAgent:
         """Check basic eligibility criteria."""
         with mlflow.start_span(name="check_basic_eligibility") as span:
             logger.info("Checking basic eligibility")
-            request: LoanRequest = state["request"]
+            request: LoanRequest = state.request
 
             span.set_attributes(
                 {
@@ -296,20 +496,16 @@ class LoanApprovalAgent:
             )
 
             # Credit score check
-            if request.credit_history.credit_score < self.config.min_credit_score:
-                state["eligible"] = False
-                state["rejection_reason"] = (
-                    f"Credit score {request.credit_history.credit_score} is below "
-                    f"minimum requirement of {self.config.min_credit_score}"
-                )
+            rejection_reason = self._credit_score_rejection(request)
+            if rejection_reason:
+                state.eligible = False
+                state.rejection_reason = rejection_reason
                 span.set_attribute("eligible", value=False)
-                span.set_attribute("rejection_reason", value=state["rejection_reason"])
+                span.set_attribute("rejection_reason", value=state.rejection_reason)
                 return state
 
-            # DTI ratio calculation
-            monthly_income = float(request.employment.monthly_income)
-            monthly_debt = float(request.financial.monthly_debt_payments)
-            dti_ratio = monthly_debt / monthly_income if monthly_income > 0 else 1.0
+            # DTI ratio calculation (reuse the ratio computed for the fast-reject gate)
+            dti_ratio = state.dti_ratio or self._calculate_dti_ratio(request)
 
             span.set_attributes(
                 {
@@ -318,39 +514,93 @@ class LoanApprovalAgent:
                 }
             )
 
-            if dti_ratio > self.config.max_dti_ratio:
-                state["eligible"] = False
-                state["rejection_reason"] = (
-                    f"Debt-to-income ratio {dti_ratio:.2%} exceeds "
-                    f"maximum allowed {self.config.max_dti_ratio:.2%}"
-                )
+            rejection_reason = self._dti_rejection(dti_ratio)
+            if rejection_reason:
+                state.eligible = False
+                state.rejection_reason = rejection_reason
                 span.set_attribute("eligible", value=False)
-                span.set_attribute("rejection_reason", value=state["rejection_reason"])
+                span.set_attribute("rejection_reason", value=state.rejection_reason)
                 return state
 
             # Employment check
             if request.employment.years_employed:
                 months_employed = float(request.employment.years_employed) * 12
                 if months_employed < self.config.min_employment_months:
-                    state["need_additional_info"] = True
-                    state["additional_info_description"] = (
+                    state.need_additional_info = True
+                    state.additional_info_description = (
                         "Employment history is less than 6 months. "
                         "Please provide additional employment verification documents."
                     )
                     span.set_attribute("need_additional_info", value=True)
                     return state
 
-            state["eligible"] = True
-            state["dti_ratio"] = dti_ratio
+            state.eligible = True
+            state.dti_ratio = dti_ratio
             span.set_attribute("eligible", value=True)
             span.set_attribute("dti_ratio", value=dti_ratio)
             return state
 
+    def _calculate_dti_ratio(self, request: LoanRequest) -> float:
+        """Calculate the debt-to-income ratio of an application."""
+        monthly_income = float(request.employment.monthly_income)
+        monthly_debt = float(request.financial.monthly_debt_payments)
+        return monthly_debt / monthly_income if monthly_income > 0 else 1.0
+
+    def _credit_score_rejection(self, request: LoanRequest) -> str | None:
+        """Return a rejection reason if the credit score is below the minimum."""
+        if request.credit_history.credit_score < self.config.min_credit_score:
+            return (
+                f"Credit score {request.credit_history.credit_score} is below "
+                f"minimum requirement of {self.config.min_credit_score}"
+            )
+        return None
+
+    def _dti_rejection(self, dti_ratio: float) -> str | None:
+        """Return a rejection reason if the DTI ratio exceeds the maximum."""
+        if dti_ratio > self.config.max_dti_ratio:
+            return (
+                f"Debt-to-income ratio {dti_ratio:.2%} exceeds "
+                f"maximum allowed {self.config.max_dti_ratio:.2%}"
+            )
+        return None
+
+    def _fast_reject(self, request: LoanRequest, dti_ratio: float) -> LoanDecision | None:
+        """Reject applications failing the credit score or DTI gates without the workflow.
+
+        These rules are deterministic, so such applications never need the LangGraph
+        workflow (and its LLM policy check) to be invoked.
+
+        Args:
+            request: Loan application request
+            dti_ratio: Debt-to-income ratio of the application
+
+        Returns:
+            Disapproval decision, or None if the application passes both gates
+
+        """
+        rejection_reason = self._credit_score_rejection(request) or self._dti_rejection(dti_ratio)
+        if rejection_reason is None:
+            return None
+        return self._disapproved_decision(rejection_reason)
+
+    @staticmethod
+    def _disapproved_decision(rejection_reason: str) -> LoanDecision:
+        """Build a disapproval decision with the given reason."""
+        return LoanDecision(
+            decision=DecisionType.DISAPPROVED,
+            risk_score=None,
+            disapproval_reason=rejection_reason,
+            recommended_amount=None,
+            recommended_term_months=None,
+            interest_rate=None,
+            monthly_payment=None,
+        )
+
     def _route_after_eligibility(self, state: AgentState) -> str:
         """Route workflow after eligibility check."""
-        if state.get("need_additional_info"):
+        if state.need_additional_info:
             return "need_info"
-        if not state.get("eligible", False):
+        if not state.eligible:
             return "reject"
         return "continue"
 
@@ -358,29 +608,91 @@ class LoanApprovalAgent:
         """Calculate risk score."""
         with mlflow.start_span(name="calculate_risk") as span:
             logger.info("Calculating risk score")
-            request: LoanRequest = state["request"]
+            request: LoanRequest = state.request
 
-            risk_score = self.risk_calculator.calculate_risk_score(
-                request, state.get("dti_ratio", 0.0)
-            )
+            risk_score = self._calculate_risk_score(request, state.dti_ratio)
 
-            state["risk_score"] = risk_score
+            state.risk_score = risk_score
             span.set_attribute("risk_score", value=risk_score)
             logger.info(f"Risk score calculated: {risk_score}")
             return state
 
+    def _fast_lane_eligible(self, state: AgentState) -> bool:
+        """Check whether an application may skip the LLM policy check.
+
+        Args:
+            state: Workflow state with the calculated risk score and DTI ratio
+
+        Returns:
+            True if the fast lane is enabled, the risk score is at or below its cutoff, the
+            credit score, DTI ratio, loan amount and (for secured loans) loan-to-value ratio
+            pass the fast lane gates and the applicant has no bankruptcy or foreclosure on record
+
+        """
+        max_risk = self.config.policy_check_skip_max_risk
+        if max_risk is None or state.risk_score > max_risk:
+            return False
+        request = state.request
+        loan = request.loan_details
+        if (
+            request.credit_history.credit_score < self.config.fast_lane_min_credit_score
+            or state.dti_ratio >= self.config.fast_lane_max_dti
+            or loan.amount > self.config.fast_lane_max_amount
+        ):
+            return False
+        if loan.purpose in _SECURED_PURPOSES and (
+            not loan.property_value
+            or loan.amount / loan.property_value >= Decimal(str(self.config.fast_lane_max_ltv))
+        ):
+            return False
+        # Derogatory records always get a policy review, however old they are
+        return not (request.financial.has_bankruptcy or request.financial.has_foreclosure)
+
     def _check_policies(self, state: AgentState) -> AgentState:
         """Check against policy documents."""
         with mlflow.start_span(name="check_policies") as span:
             logger.info("Checking policy compliance")
-            request: LoanRequest = state["request"]
+            request: LoanRequest = state.request
 
-            policy_check_result = self.policy_checker.check_compliance(
-                request, state.get("risk_score", 50)
-            )
+            # Without policy text the LLM has nothing to check against, so skip the call
+            if not self.policy_content:
+                logger.warning("Policy documents unavailable, skipping LLM policy check")
+                state.policy_compliant = True
+                state.policy_notes = "Policy documents unavailable; decision based on risk only"
+                span.set_attributes(
+                    {
+                        "policy_compliant": True,
+                        "policy_notes": state.policy_notes,
+                    }
+                )
+                return state
 
-            state["policy_compliant"] = policy_check_result["compliant"]
-            state["policy_notes"] = policy_check_result.get("notes", "")
+            # Opt-in fast lane: low-risk applications are decided by the rules alone
+            fast_lane = self._fast_lane_eligible(state)
+            if self.config.policy_check_skip_max_risk is not None:
+                # The mean of this metric is the share of applications taking the fast lane
+                self.metrics_tracker.log_metrics(
+                    {"policy_fast_lane": float(fast_lane)}, synchronous=False
+                )
+            if fast_lane:
+                logger.info(f"Risk score {state.risk_score} is low, skipping LLM policy check")
+                state.policy_compliant = True
+                state.policy_notes = (
+                    "Policy check skipped for a low-risk application passing the fast lane gates"
+                )
+                span.set_attributes(
+                    {
+                        "policy_compliant": True,
+                        "policy_notes": state.policy_notes,
+                        "fast_lane": True,
+                    }
+                )
+                return state
+
+            policy_check_result = self._check_compliance(request, state.risk_score)
+
+            state.policy_compliant = policy_check_result["compliant"]
+            state.policy_notes = policy_check_result.get("notes", "")
 
             span.set_attributes(
                 {
@@ -405,9 +717,9 @@ class LoanApprovalAgent:
                     missing_str = ", ".join(missing_info)
                     rejection_parts.append(f"Missing information: {missing_str}")
 
-                state["rejection_reason"] = ". ".join(rejection_parts)
+                state.rejection_reason = ". ".join(rejection_parts)
 
-                span.set_attribute("rejection_reason", value=state["rejection_reason"])
+                span.set_attribute("rejection_reason", value=state.rejection_reason)
 
             return state
 
@@ -417,48 +729,39 @@ class LoanApprovalAgent:
             logger.info("Making final decision")
 
             # Check for rejection
-            if state.get("rejection_reason"):
-                decision = LoanDecision(
-                    decision=DecisionType.DISAPPROVED,
-                    risk_score=None,
-                    disapproval_reason=state["rejection_reason"],
-                    recommended_amount=None,
-                    recommended_term_months=None,
-                    interest_rate=None,
-                    monthly_payment=None,
-                )
-                state["decision"] = decision
+            if state.rejection_reason:
+                state.decision = self._disapproved_decision(state.rejection_reason)
                 span.set_attributes(
                     {
                         "decision": DecisionType.DISAPPROVED.value,
-                        "rejection_reason": state["rejection_reason"],
+                        "rejection_reason": state.rejection_reason,
                     }
                 )
                 return state
 
             # Check for additional info needed
-            if state.get("need_additional_info"):
+            if state.need_additional_info:
                 decision = LoanDecision(
                     decision=DecisionType.ADDITIONAL_INFO_NEEDED,
-                    additional_info_description=state["additional_info_description"],
+                    additional_info_description=state.additional_info_description,
                     risk_score=None,
                     recommended_amount=None,
                     recommended_term_months=None,
                     interest_rate=None,
                     monthly_payment=None,
                 )
-                state["decision"] = decision
+                state.decision = decision
                 span.set_attributes(
                     {
                         "decision": DecisionType.ADDITIONAL_INFO_NEEDED.value,
-                        "additional_info_description": state["additional_info_description"],
+                        "additional_info_description": state.additional_info_description,
                     }
                 )
                 return state
 
             # Approved
-            request: LoanRequest = state["request"]
-            risk_score = state.get("risk_score", 50)
+            request: LoanRequest = state.request
+            risk_score = state.risk_score
 
             # Calculate interest rate based on risk
             interest_rate = self._calculate_interest_rate(risk_score)
@@ -466,27 +769,25 @@ class LoanApprovalAgent:
             # Calculate monthly payment
             loan_amount = float(request.loan_details.amount)
             term_months = request.loan_details.term_months
-            monthly_rate = float(interest_rate) / 100 / 12
-            monthly_payment = (loan_amount * monthly_rate * (1 + monthly_rate) ** term_months) / (
-                (1 + monthly_rate) ** term_months - 1
-            )
+            monthly_rate = interest_rate / 100 / 12
+            monthly_payment = _amortized_payment(loan_amount, monthly_rate, term_months)
 
             decision = LoanDecision(
                 decision=DecisionType.APPROVED,
                 risk_score=risk_score,
-                interest_rate=Decimal(str(interest_rate)),
+                interest_rate=INTEREST_RATE_DECIMALS[risk_score],
                 monthly_payment=Decimal(str(round(monthly_payment, 2))),
                 recommended_amount=request.loan_details.amount,
                 recommended_term_months=term_months,
             )
 
-            state["decision"] = decision
+            state.decision = decision
             span.set_attributes(
                 {
                     "decision": DecisionType.APPROVED.value,
                     "risk_score": risk_score,
                     "interest_rate": interest_rate,
-                    "monthly_payment": float(monthly_payment),
+                    "monthly_payment": monthly_payment,
                 }
             )
             logger.info(f"Loan approved with risk score {risk_score}")
@@ -494,11 +795,7 @@ class LoanApprovalAgent:
 
     def _calculate_interest_rate(self, risk_score: int) -> float:
         """Calculate interest rate based on risk score."""
-        # Base rate + risk premium
-        base_rate = 3.5
-        max_premium = 10.0
-        risk_premium = (risk_score / 100) * max_premium
-        return base_rate + risk_premium
+        return INTEREST_RATE_TABLE[risk_score]
 
     def process_loan_request(self, request: LoanRequest) -> LoanOutcome:
         """Process a loan request and return decision.
@@ -510,20 +807,21 @@ class LoanApprovalAgent:
             Loan outcome with decision
 
         """
-        start_time = time.time()
-        trace_id = f"trace-{request.request_id}-{int(time.time())}"
+        start_ns = time.perf_counter_ns()
+        wall_start = datetime.now(tz=timezone.utc)
+        trace_id = f"trace-{request.request_id}-{int(wall_start.timestamp())}"
 
         logger.info(f"Processing loan request {request.request_id}")
 
         try:
             # Start a trace for the entire loan processing workflow
-            with (
-                self.metrics_tracker.start_run(run_name=f"loan-{request.request_id}"),
-                mlflow.start_span(
-                    name="loan_approval_workflow",
-                    span_type="CHAIN",
-                ) as trace,
-            ):
+            with mlflow.start_span(
+                name="loan_approval_workflow",
+                span_type="CHAIN",
+            ) as trace:
+                # Request metrics are logged as a step of the worker run
+                metrics_step = next(self._request_counter)
+
                 # Set trace attributes
                 trace.set_attributes(
                     {
@@ -533,39 +831,44 @@ class LoanApprovalAgent:
                         "credit_score": request.credit_history.credit_score,
                         "employment_status": request.employment.status.value,
                         "model_version": self.config.agent_version,
-                    }
-                )
-                # Log request parameters
-                self.metrics_tracker.log_params(
-                    {
-                        "request_id": request.request_id,
-                        "loan_amount": float(request.loan_details.amount),
-                        "credit_score": request.credit_history.credit_score,
-                        "employment_status": request.employment.status.value,
+                        "metrics_step": metrics_step,
                     }
                 )
 
-                # Execute workflow
-                initial_state = {
-                    "request": request,
-                    "trace_id": trace_id,
-                }
+                # Checked once here, covering both the fast reject and the workflow
+                self.security_context.require_all_permissions(*self.REQUIRED_PERMISSIONS)
 
-                final_state = self.workflow.invoke(initial_state)
-                decision: LoanDecision = final_state["decision"]
+                # Execute workflow
+                dti_ratio = self._calculate_dti_ratio(request)
+                decision = self._fast_reject(request, dti_ratio)
+                if decision is None:
+                    initial_state = AgentState(
+                        request=request, trace_id=trace_id, dti_ratio=dti_ratio
+                    )
+                    final_state = self.workflow.invoke(initial_state)
+                    decision = final_state["decision"]
+                else:
+                    logger.info(f"Loan request {request.request_id} rejected by basic rules")
+                    trace.set_attribute("fast_reject", value=True)
 
                 # Calculate processing time
-                processing_time_ms = int((time.time() - start_time) * 1000)
+                processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 # Log metrics
                 self.metrics_tracker.log_metrics(
                     {
                         "processing_time_ms": float(processing_time_ms),
                         "risk_score": float(decision.risk_score or 0),
-                    }
+                        f"decision_{decision.decision.value}": 1.0,
+                    },
+                    step=metrics_step,
+                    # Queue the write so the tracking store round-trip stays off the request
+                    synchronous=False,
                 )
 
-                self.metrics_tracker.set_tag("decision", decision.decision.value)
+                # Per-request values live on the trace, since params and tags of the shared
+                # worker run cannot vary between requests
+                trace.set_attribute("decision", decision.decision.value)
 
                 # Set trace outputs
                 trace.set_outputs(
@@ -582,6 +885,7 @@ class LoanApprovalAgent:
                     decision=decision,
                     processing_time_ms=processing_time_ms,
                     model_version=self.config.agent_version,
+                    # When the decision was made; perf_counter_ns only measures the duration
                     timestamp=datetime.now(tz=timezone.utc),
                     agent_trace_id=trace_id,
                 )
@@ -592,6 +896,41 @@ class LoanApprovalAgent:
                 return outcome
 
         except Exception:
-            logger.exception(f"Error processing loan request {request.request_id}")
+            elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.exception(
+                f"Error processing loan request {request.request_id} after {elapsed_ms}ms"
+            )
             # Re-raise the exception to let the API layer handle it with proper HTTP error codes
             raise
+
+    async def process_loan_requests(
+        self, requests: Sequence[LoanRequest], max_concurrency: int | None = None
+    ) -> list[LoanOutcome | Exception]:
+        """Process several loan requests concurrently.
+
+        Each request runs through process_loan_request on a worker thread, so the LLM
+        round-trips of up to max_concurrency requests overlap instead of queuing. Worker
+        threads come from anyio's default limiter, which the API sizes with
+        API_THREAD_POOL_SIZE and shares with single-request evaluations.
+
+        Args:
+            requests: Loan application requests
+            max_concurrency: Maximum requests in flight (defaults to batch_max_concurrency)
+
+        Returns:
+            For each request, in order, its loan outcome or the exception that made it fail
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.batch_max_concurrency)
+
+        async def process(request: LoanRequest) -> LoanOutcome | Exception:
+            async with semaphore:
+                try:
+                    return await anyio.to_thread.run_sync(self.process_loan_request, request)
+                except Exception as e:
+                    # One failing application must not discard the rest of the batch;
+                    # process_loan_request already logged the traceback
+                    logger.warning(f"Batch item {request.request_id} failed: {e!s}")
+                    return e
+
+        return list(await asyncio.gather(*(process(request) for request in requests)))
@@ -1,46 +1,77 @@
 """REST API for loan approval agent."""
 
+import os
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
+
+import anyio.to_thread
+import mlflow
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Body, FastAPI, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
 
 from agents.loan_approval.src.agent import LoanApprovalAgent
 from agents.loan_approval.src.config import config
-from shared.models.loan import LoanOutcome, LoanRequest
+from shared.models.loan import LoanEvaluationError, LoanOutcome, LoanRequest
 from shared.monitoring import get_logger, setup_logging
 
 # Setup logging
 setup_logging(level=config.log_level)
 logger = get_logger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title="Loan Approval Agent API",
-    description="AI Agent for automated loan application processing",
-    version=config.agent_version,
-)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class ORJSONRequest(Request):
+    """Request that decodes JSON bodies with orjson instead of the standard library."""
+
+    async def json(self) -> Any:
+        """Parse the request body as JSON."""
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands its endpoint an ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default handler so request bodies are decoded with orjson."""
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+_BATCH_RESULTS = TypeAdapter(list[LoanOutcome | LoanEvaluationError])
 
 # Initialize agent
 agent: LoanApprovalAgent | None = None
 agent_health_status: dict = {}
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """Initialize agent on startup."""
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Initialize agent on startup and clean up on shutdown."""
     global agent, agent_health_status  # noqa: PLW0603
     logger.info("Starting Loan Approval Agent API")
 
+    # Agents run on worker threads and mostly wait on the LLM, so allow more of them in flight
+    anyio.to_thread.current_default_thread_limiter().total_tokens = config.api_thread_pool_size
+
+    if not config.enable_tracing:
+        # Tracing is process-wide in MLflow, so it is switched off here rather than per agent;
+        # spans opened by the workflow become no-ops
+        mlflow.tracing.disable()
+
     agent = LoanApprovalAgent()
+    # Build the workflow now so the first request does not pay for the langgraph import
+    _ = agent.workflow
     logger.info("Agent initialized successfully")
 
     # Perform health check with LLM
@@ -54,13 +85,31 @@ async def startup_event() -> None:
 
     logger.info("Startup health check passed - system fully operational")
 
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Cleanup on shutdown."""
     logger.info("Shutting down Loan Approval Agent API")
 
 
+# Create FastAPI app
+app = FastAPI(
+    title="Loan Approval Agent API",
+    description="AI Agent for automated loan application processing",
+    version=config.agent_version,
+    lifespan=lifespan,
+)
+app.router.route_class = ORJSONRoute
+
+# Add CORS middleware with an explicit allowlist; a "*" wildcard cannot be combined
+# with credentials and makes Starlette echo back every request origin
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=config.cors_origins,
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+)
+
+
 @app.get("/")
 async def root() -> dict:
     """Root endpoint."""
@@ -107,15 +156,15 @@ async def health() -> dict:
     }
 
 
-@app.post("/api/v1/loan/evaluate")
-async def evaluate_loan(request: LoanRequest) -> LoanOutcome:
+@app.post("/api/v1/loan/evaluate", response_model=LoanOutcome)
+async def evaluate_loan(request: LoanRequest) -> Response:
     """Evaluate a loan application.
 
     Args:
         request: Loan application request
 
     Returns:
-        Loan outcome with decision
+        JSON response with the loan outcome, serialized in a single pass by pydantic
 
     Raises:
         HTTPException: If agent is not initialized or processing fails
@@ -130,11 +179,14 @@ async def evaluate_loan(request: LoanRequest) -> LoanOutcome:
 
     try:
         logger.info(f"Received loan evaluation request: {request.request_id}")
-        outcome = agent.process_loan_request(request)
+        # Run the blocking agent on a worker thread so the event loop keeps serving requests
+        outcome = await run_in_threadpool(agent.process_loan_request, request)
         logger.info(
             f"Loan evaluation completed: {request.request_id} - {outcome.decision.decision.value}"
         )
-        return outcome
+        # The agent already returns a validated LoanOutcome, so skip FastAPI's
+        # re-validation and jsonable_encoder pass and dump it straight to JSON bytes
+        return Response(content=outcome.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.exception(f"Error processing loan request {request.request_id}")
         raise HTTPException(
@@ -143,6 +195,47 @@ async def evaluate_loan(request: LoanRequest) -> LoanOutcome:
         ) from e
 
 
+@app.post("/api/v1/loan/evaluate_batch", response_model=list[LoanOutcome | LoanEvaluationError])
+async def evaluate_loan_batch(
+    requests: Annotated[list[LoanRequest], Body(min_length=1, max_length=config.batch_max_size)],
+) -> Response:
+    """Evaluate several loan applications concurrently.
+
+    An application that fails to process does not fail the batch; its entry holds the
+    error instead of an outcome.
+
+    Args:
+        requests: Loan application requests
+
+    Returns:
+        JSON response with a loan outcome or evaluation error per request, in request order
+
+    Raises:
+        HTTPException: If agent is not initialized
+
+    """
+    if agent is None:
+        logger.error("Agent not initialized")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Agent not initialized",
+        )
+
+    logger.info(f"Received batch of {len(requests)} loan evaluation requests")
+    results = await agent.process_loan_requests(requests)
+    items = [
+        LoanEvaluationError(
+            request_id=request.request_id, error=f"Error processing loan request: {result!s}"
+        )
+        if isinstance(result, Exception)
+        else result
+        for request, result in zip(requests, results, strict=True)
+    ]
+    failed = sum(isinstance(item, LoanEvaluationError) for item in items)
+    logger.info(f"Batch loan evaluation completed: {len(items)} requests, {failed} failed")
+    return Response(content=_BATCH_RESULTS.dump_json(items), media_type="application/json")
+
+
 @app.get("/api/v1/metrics")
 async def get_metrics() -> dict:
     """Get agent metrics.
@@ -161,12 +254,22 @@ async def get_metrics() -> dict:
 
 def main() -> None:
     """Main entry point for the API server."""
-    logger.info(f"Starting API server on {config.api_host}:{config.api_port}")
+    reload = config.environment == "development"
+    # Auto-reload only supports a single worker; otherwise default to half the CPUs
+    workers = 1 if reload else config.api_workers or max(1, (os.cpu_count() or 2) // 2)
+    logger.info(
+        f"Starting API server on {config.api_host}:{config.api_port} with {workers} worker(s)"
+    )
     uvicorn.run(
         "api:app",
         host=config.api_host,
         port=config.api_port,
-        reload=config.environment == "development",
+        reload=reload,
+        workers=workers,
+        # uvloop is not installed on Windows; "auto" falls back to asyncio there
+        loop="auto",
+        http="httptools",
+        access_log=config.api_access_log,
         log_level=config.log_level.lower(),
     )
 
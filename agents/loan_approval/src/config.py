@@ -41,7 +41,7 @@ class AgentConfig(BaseSettings):
     azure_openai_api_key: str | None = None  # Loaded from AZURE_OPENAI_API_KEY env var
     azure_openai_endpoint: str | None = None  # e.g., https://your-resource.openai.azure.com/
     azure_openai_deployment: str | None = None  # Your deployment name
-    azure_openai_api_version: str = "2024-02-01"  # Azure OpenAI API version
+    azure_openai_api_version: str = "2024-10-21"  # Needs max_completion_tokens support
 
     # MLFlow settings
     mlflow_tracking_uri: str | None = None
@@ -66,12 +66,29 @@ class AgentConfig(BaseSettings):
 
     # Policy documents
     policies_directory: str = "../policies"
+    require_policies: bool = False  # Fail at startup instead of skipping the policy check
+    policy_check_cache_size: int = 256  # LLM compliance results cached by prompt (0 = off)
+    policy_check_json_mode: bool = False  # Needs a model supporting json_object responses
+    policy_check_screening_model: str | None = None  # Cheaper model/deployment asked first
+    policy_check_screening_min_confidence: float = 0.8  # Final screening verdicts only
+    policy_check_skip_max_risk: int | None = None  # Approve on rules at or below this risk
+    fast_lane_min_credit_score: int = 700  # Fast lane also needs at least this credit score
+    fast_lane_max_dti: float = 0.30  # ...a debt-to-income ratio below this
+    fast_lane_max_amount: int = 500000  # ...a loan amount at or below this
+    fast_lane_max_ltv: float = 0.8  # ...and, for secured loans, a loan-to-value below this
+    batch_max_concurrency: int = 16  # Requests in flight when processing a batch
+    batch_max_size: int = 100  # Most applications accepted by the batch endpoint
 
     # API settings
     # Binding to 0.0.0.0 allows container networking
     # Restrict in production via firewall/security groups
     api_host: str = "0.0.0.0"  # noqa: S104
     api_port: int = 8000
+    api_workers: int | None = None  # API processes; unset means half the CPU count
+    api_thread_pool_size: int = 64  # Worker threads running agent requests per API process
+    api_access_log: bool = True  # Uvicorn writes a line per request; disable in production
+    # Browser origins allowed to call the API (JSON list in the CORS_ORIGINS env var)
+    cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
 
     # Risk scoring thresholds
     min_credit_score: int = 580
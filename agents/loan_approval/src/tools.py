@@ -1,17 +1,176 @@
 """Tools and utilities for loan approval agent."""
 
+import copy
 import json
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
+import numpy as np
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import LanguageModelInput
+    from langchain_core.messages import BaseMessage
+    from langchain_core.runnables import Runnable
+    from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from agents.loan_approval.src.config import AgentConfig
 from shared.models.loan import LoanRequest
-from shared.monitoring import get_logger
+from shared.monitoring import MetricsTracker, get_logger
 
 logger = get_logger(__name__)
 
+# Policy text included in the compliance prompt is truncated to stay within token limits
+POLICY_PROMPT_MAX_CHARS = 3000
+
+# Header PDFLoader writes before each document when loading several PDFs
+_POLICY_DOCUMENT_HEADER = re.compile(r"=== Document: .+? ===\n")
+
+POLICY_PROMPT_INSTRUCTIONS = """
+
+Analyze this application and respond in the following JSON format:
+{
+    "compliant": true/false,
+    "notes": "Detailed explanation of the decision (be thorough and complete)",
+    "reason": "Specific reason if not compliant (empty if compliant)",
+    "missing_information": ["list of any required information missing from the application"]
+}
+
+Be strict in your evaluation and ensure all policy requirements are met.
+If the application is missing required information, list all missing fields in \
+the missing_information array.
+Provide complete and detailed notes - do not truncate your explanation.
+"""
+
+# Appended to screening prompts; only verdicts the screening model is sure of are final
+SCREENING_PROMPT_INSTRUCTIONS = """
+Also include a "confidence" field in the JSON: a number from 0 to 1 stating how certain \
+you are of your decision."""
+
+
+# Risk bands as (ascending thresholds, points per band) lookup tables for batch scoring
+_CREDIT_SCORE_BANDS = (np.array([600, 650, 700, 750, 800]), np.array([30, 25, 20, 15, 10, 5]))
+_DTI_BANDS = (np.array([0.25, 0.30, 0.35, 0.40]), np.array([5, 10, 15, 20, 25]))
+_EMPLOYMENT_YEARS_BANDS = (np.array([1.0, 2.0, 5.0]), np.array([15, 12, 8, 3]))
+_UTILIZATION_BANDS = (np.array([20.0, 40.0, 60.0, 80.0]), np.array([0, 3, 5, 8, 10]))
+_YEARS_SINCE_EVENT_BANDS = (np.array([3.0, 5.0, 7.0]), np.array([10, 7, 5, 0]))
+_LTV_BANDS = (np.array([0.80, 0.85, 0.90, 0.95]), np.array([0, 4, 6, 8, 10]))
+
+
+def _policy_excerpt(policy_content: str, max_chars: int) -> str:
+    """Truncate policy text to a character budget shared evenly by its documents.
+
+    Cutting the concatenated text would keep only the first documents; instead every
+    document gets an equal share, and shares left unused by short documents go to the
+    longer ones.
+
+    Args:
+        policy_content: Policy text, possibly several documents concatenated by PDFLoader
+        max_chars: Character budget for the excerpt
+
+    Returns:
+        Policy excerpt of about max_chars characters
+
+    """
+    if len(policy_content) <= max_chars:
+        return policy_content
+
+    starts = [match.start() for match in _POLICY_DOCUMENT_HEADER.finditer(policy_content)]
+    if len(starts) < 2:
+        return policy_content[:max_chars]
+
+    documents = [
+        policy_content[start:end].rstrip()
+        for start, end in zip(starts, [*starts[1:], len(policy_content)], strict=True)
+    ]
+    kept_chars = [0] * len(documents)
+    remaining = max_chars
+    by_length = sorted(range(len(documents)), key=lambda i: len(documents[i]))
+    for position, index in enumerate(by_length):
+        kept_chars[index] = min(len(documents[index]), remaining // (len(documents) - position))
+        remaining -= kept_chars[index]
+
+    return "\n\n".join(
+        document[:kept] for document, kept in zip(documents, kept_chars, strict=True)
+    )
+
+
+def _band_points(
+    values: np.ndarray, bands: tuple[np.ndarray, np.ndarray], *, below: bool
+) -> np.ndarray:
+    """Look up the points of each value's band with a single binary search pass.
+
+    Args:
+        values: Values to score
+        bands: Ascending thresholds and the points of each of the len(thresholds) + 1 bands
+        below: True for "value < threshold" ladders, False for "value > threshold" ladders
+
+    Returns:
+        Points for each value
+
+    """
+    thresholds, points = bands
+    band: np.ndarray = points[
+        np.searchsorted(thresholds, values, side="right" if below else "left")
+    ]
+    return band
+
+
+def _risk_scores(  # noqa: PLR0913
+    *,
+    credit_score: np.ndarray,
+    dti_ratio: np.ndarray,
+    years_employed: np.ndarray,
+    utilization: np.ndarray,
+    late_12m: np.ndarray,
+    late_24m: np.ndarray,
+    years_since_bankruptcy: np.ndarray,
+    years_since_foreclosure: np.ndarray,
+    ltv: np.ndarray,
+) -> np.ndarray:
+    """Vectorized form of RiskCalculator.calculate_risk_score over arrays of applicants.
+
+    Missing values (no employment history, no bankruptcy/foreclosure, no property value)
+    are encoded as NaN and masked out, since searchsorted places NaN in the last band.
+    """
+    scores = _band_points(credit_score, _CREDIT_SCORE_BANDS, below=True)
+    scores += _band_points(dti_ratio, _DTI_BANDS, below=False)
+    employed = ~np.isnan(years_employed) & (years_employed != 0)
+    scores += np.where(
+        employed, _band_points(years_employed, _EMPLOYMENT_YEARS_BANDS, below=True), 0
+    )
+    scores += _band_points(utilization, _UTILIZATION_BANDS, below=False)
+    scores += np.select([late_12m > 2, late_12m > 0, late_24m > 3], (10, 7, 5), default=0)
+    for years_since in (years_since_bankruptcy, years_since_foreclosure):
+        # Zero years since the event scores nothing, matching the scalar truthiness check
+        scores += np.where(
+            years_since != 0, _band_points(years_since, _YEARS_SINCE_EVENT_BANDS, below=True), 0
+        )
+    scores += np.where(np.isnan(ltv), 0, _band_points(ltv, _LTV_BANDS, below=False))
+    capped: np.ndarray = np.minimum(scores, 100)
+    return capped
+
+
+class RiskInputs(NamedTuple):
+    """Risk scoring inputs of one application, converted from Decimal to float once.
+
+    Decimal is kept in the models for exact money handling at the API boundary; a 0-100
+    risk score does not need cent precision, so scoring works on floats. Missing values
+    are None (and become NaN when packed into arrays for batch scoring).
+    """
+
+    credit_score: int
+    years_employed: float | None
+    utilization: float
+    late_12m: int
+    late_24m: int
+    years_since_bankruptcy: float | None
+    years_since_foreclosure: float | None
+    ltv: float | None
+
 
 class RiskCalculator:
     """Calculate risk scores for loan applications."""
@@ -134,28 +293,141 @@ class RiskCalculator:
         logger.info(f"Calculated risk score: {final_score}")
         return final_score
 
-    def _years_since(self, past_date: date | None) -> float | None:
+    def calculate_risk_scores_batch(
+        self, requests: Sequence[LoanRequest], dti_ratios: Sequence[float]
+    ) -> np.ndarray:
+        """Calculate risk scores for many applications at once.
+
+        Produces the same scores as calculate_risk_score, but evaluates each scoring band
+        as an array operation instead of a per-request branch ladder.
+
+        Args:
+            requests: Loan application requests
+            dti_ratios: Debt-to-income ratio of each request
+
+        Returns:
+            Integer array of risk scores from 0 to 100, in request order
+
+        """
+        today = datetime.now(tz=timezone.utc).date()
+        rows = [self._risk_inputs(request, today) for request in requests]
+        # One float64 column per input field; None becomes NaN
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(RiskInputs._fields))
+        columns = dict(zip(RiskInputs._fields, matrix.T, strict=True))
+        scores = _risk_scores(dti_ratio=np.asarray(dti_ratios, dtype=np.float64), **columns)
+        logger.info(f"Calculated {len(scores)} risk scores in batch")
+        return scores
+
+    def _risk_inputs(self, request: LoanRequest, today: date) -> RiskInputs:
+        """Extract the scoring inputs of a request, converting each Decimal field once.
+
+        Args:
+            request: Loan application request
+            today: Reference date for the years since bankruptcy/foreclosure
+
+        Returns:
+            Float scoring inputs
+
+        """
+        employment = request.employment
+        credit = request.credit_history
+        financial = request.financial
+        loan = request.loan_details
+        return RiskInputs(
+            credit_score=credit.credit_score,
+            years_employed=(
+                float(employment.years_employed) if employment.years_employed is not None else None
+            ),
+            utilization=float(credit.credit_utilization),
+            late_12m=credit.number_of_late_payments_12m,
+            late_24m=credit.number_of_late_payments_24m,
+            years_since_bankruptcy=(
+                self._years_since(financial.bankruptcy_date, today)
+                if financial.has_bankruptcy
+                else None
+            ),
+            years_since_foreclosure=(
+                self._years_since(financial.foreclosure_date, today)
+                if financial.has_foreclosure
+                else None
+            ),
+            ltv=(float(loan.amount) / float(loan.property_value) if loan.property_value else None),
+        )
+
+    def _years_since(self, past_date: date | None, today: date | None = None) -> float | None:
         """Calculate years since a past date."""
         if not past_date:
             return None
-        delta = datetime.now(tz=timezone.utc).date() - past_date
+        delta = (today or datetime.now(tz=timezone.utc).date()) - past_date
         return delta.days / 365.25
 
 
 class PolicyChecker:
     """Check loan applications against policy documents."""
 
-    def __init__(self, llm: ChatOpenAI | AzureChatOpenAI, policy_content: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        llm: "ChatOpenAI | AzureChatOpenAI",
+        policy_content: str,
+        cache_size: int = 256,
+        *,
+        json_mode: bool = False,
+        screening_llm: "ChatOpenAI | AzureChatOpenAI | None" = None,
+        screening_min_confidence: float = 0.8,
+        metrics_tracker: MetricsTracker | None = None,
+    ) -> None:
         """Initialize policy checker.
 
         Args:
             llm: Language model for policy analysis (supports OpenAI or Azure OpenAI)
             policy_content: Loaded policy document content
+            cache_size: Number of compliance results cached by prompt (0 disables caching)
+            json_mode: Request OpenAI JSON mode so answers are bare JSON objects
+                (requires a model that supports the json_object response format)
+            screening_llm: Optional cheaper model asked first; its verdicts stated with at least
+                screening_min_confidence are final, every other answer is escalated to llm
+            screening_min_confidence: Confidence the screening model must state for its verdict
+                to be final
+            metrics_tracker: Optional tracker receiving the screening escalation rate
 
         """
         self.llm = llm
         self.policy_content = policy_content
 
+        # JSON mode is bound only for compliance checks; it rejects prompts (such as the
+        # health check) that do not mention JSON
+        self._compliance_llm = self._bind_compliance(llm, json_mode=json_mode)
+        self._screening_llm = (
+            self._bind_compliance(screening_llm, json_mode=json_mode) if screening_llm else None
+        )
+        self._screening_min_confidence = screening_min_confidence
+        self._metrics_tracker = metrics_tracker
+
+        # The prompt holds every application field the LLM sees, so identical prompts
+        # (resubmitted or duplicate applications) can reuse the earlier LLM answer. The
+        # LRU dict is guarded by a lock because checks run on the API's worker threads
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # The policy section is identical for every request, so render it once
+        self._prompt_prefix = f"""You are a loan policy compliance expert. Review the following \
+loan application against the provided policy documents and determine if it complies with all \
+policies.
+
+POLICY DOCUMENTS:
+{_policy_excerpt(policy_content, POLICY_PROMPT_MAX_CHARS)}
+
+LOAN APPLICATION:
+"""
+
+    @staticmethod
+    def _bind_compliance(
+        llm: "ChatOpenAI | AzureChatOpenAI", *, json_mode: bool
+    ) -> "Runnable[LanguageModelInput, BaseMessage]":
+        """Prepare a model for compliance prompts, in JSON mode if requested."""
+        return llm.bind(response_format={"type": "json_object"}) if json_mode else llm
+
     def _format_property_info(self, property_info: Any) -> str:
         """Format property information for display."""
         if not property_info:
@@ -194,19 +466,8 @@ class PolicyChecker:
 - Appraisal Report: {doc_info.appraisal_report or "Not provided"}
 - Title Report: {doc_info.title_report or "Not provided"}"""
 
-    def check_compliance(self, request: LoanRequest, risk_score: int) -> dict[str, Any]:
-        """Check loan request compliance with policies.
-
-        Args:
-            request: Loan application request
-            risk_score: Calculated risk score
-
-        Returns:
-            Dictionary with compliance result
-
-        """
-        logger.info("Checking policy compliance with LLM")
-
+    def _build_prompt(self, request: LoanRequest, risk_score: int) -> str:
+        """Build the policy compliance prompt for a loan request."""
         # Calculate total assets
         total_assets = (
             (request.financial.checking_balance or 0)
@@ -256,107 +517,165 @@ DOCUMENTATION:
 {self._format_documentation_info(request.documentation)}
 """
 
-        prompt = f"""You are a loan policy compliance expert. Review the following loan \
-application against the provided policy documents and determine if it complies with all policies.
+        return f"{self._prompt_prefix}{loan_summary}{POLICY_PROMPT_INSTRUCTIONS}"
 
-POLICY DOCUMENTS:
-{self.policy_content[:3000]}  # Truncate for token limits
+    def check_compliance(self, request: LoanRequest, risk_score: int) -> dict[str, Any]:
+        """Check loan request compliance with policies.
 
-LOAN APPLICATION:
-{loan_summary}
+        Args:
+            request: Loan application request
+            risk_score: Calculated risk score
 
-Analyze this application and respond in the following JSON format:
-{{
-    "compliant": true/false,
-    "notes": "Detailed explanation of the decision (be thorough and complete)",
-    "reason": "Specific reason if not compliant (empty if compliant)",
-    "missing_information": ["list of any required information missing from the application"]
-}}
+        Returns:
+            Dictionary with compliance result
 
-Be strict in your evaluation and ensure all policy requirements are met.
-If the application is missing required information, list all missing fields in \
-the missing_information array.
-Provide complete and detailed notes - do not truncate your explanation.
-"""
+        """
+        logger.info("Checking policy compliance with LLM")
+        prompt = self._build_prompt(request, risk_score)
 
         try:
-            # LLM invocation - callbacks configured in the LLM instance will automatically
-            # log prompts, responses, tokens, and timing to MLflow and logs
-            response = self.llm.invoke(prompt)
-            result_text = response.content
-
-            # Ensure result_text is a string for processing
-            if isinstance(result_text, list):
-                result_text = " ".join(str(item) for item in result_text)
-            else:
-                result_text = str(result_text)
+            return self._invoke_cached(prompt)
+        except Exception:
+            logger.exception("Error in policy compliance check")
+            # Re-raise the exception instead of silently returning compliant
+            raise
 
-            logger.info(f"Policy check response: {result_text}")
+    def _invoke_cached(self, prompt: str) -> dict[str, Any]:
+        """Answer a compliance prompt from the cache, invoking the LLM on a miss.
 
-            # Parse response - try JSON first, fallback to text parsing
-            try:
-                # Try to extract JSON from response (it might be wrapped in markdown)
-                json_start = result_text.find("{")
-                json_end = result_text.rfind("}") + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = result_text[json_start:json_end]
-                    parsed = json.loads(json_str)
-
-                    if parsed.get("compliant", False):
-                        return {
-                            "compliant": True,
-                            "notes": parsed.get("notes", "Application complies with all policies"),
-                        }
-                    # Not compliant - return detailed information
+        Returns a deep copy, so callers cannot modify the cached result or its lists.
+        """
+        if self._cache_size <= 0:
+            return self._invoke(prompt)
+
+        with self._cache_lock:
+            result = self._cache.get(prompt)
+            if result is not None:
+                self._cache.move_to_end(prompt)
+        if result is None:
+            # Concurrent misses on one prompt may each call the LLM; the last answer is kept
+            result = self._invoke(prompt)
+            with self._cache_lock:
+                self._cache[prompt] = result
+                self._cache.move_to_end(prompt)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def _invoke(self, prompt: str) -> dict[str, Any]:
+        """Send a compliance prompt to the LLM and parse its answer."""
+        # LLM invocation - callbacks configured in the LLM instance will automatically
+        # log prompts, responses, tokens, and timing to MLflow and logs
+        if self._screening_llm is not None:
+            response = self._screening_llm.invoke(prompt + SCREENING_PROMPT_INSTRUCTIONS)
+            result = self._screening_verdict(response.content)
+            if self._metrics_tracker is not None:
+                # The mean of this metric is the share of screened applications escalated
+                self._metrics_tracker.log_metrics(
+                    {"policy_screening_escalated": float(result is None)}, synchronous=False
+                )
+            if result is not None:
+                return result
+            logger.info("Screening model is not confident in its verdict, escalating")
+
+        response = self._compliance_llm.invoke(prompt)
+        return self._parse_response(response.content)
+
+    def _screening_verdict(self, result_text: str | list[Any]) -> dict[str, Any] | None:
+        """Return the screening model's answer if it states a confident verdict.
+
+        Malformed answers and verdicts below the confidence threshold return None so the
+        application is escalated to the main model.
+        """
+        text = self._response_text(result_text)
+        try:
+            parsed = json.loads(text[text.find("{") : text.rfind("}") + 1])
+        except (json.JSONDecodeError, ValueError):
+            return None
+        if not isinstance(parsed, dict) or not isinstance(parsed.get("compliant"), bool):
+            return None
+        confidence = parsed.get("confidence")
+        if (
+            isinstance(confidence, bool)
+            or not isinstance(confidence, int | float)
+            or confidence < self._screening_min_confidence
+        ):
+            return None
+        return self._parse_response(text)
+
+    @staticmethod
+    def _response_text(result_text: str | list[Any]) -> str:
+        """Join a message content into a single string."""
+        if isinstance(result_text, list):
+            return " ".join(str(item) for item in result_text)
+        return str(result_text)
+
+    def _parse_response(self, result_text: str | list[Any]) -> dict[str, Any]:
+        """Parse the LLM policy compliance response into a result dictionary."""
+        # Ensure result_text is a string for processing
+        result_text = self._response_text(result_text)
+
+        logger.info(f"Policy check response: {result_text}")
+
+        # Parse response - try JSON first, fallback to text parsing
+        try:
+            # Try to extract JSON from response (it might be wrapped in markdown)
+            json_start = result_text.find("{")
+            json_end = result_text.rfind("}") + 1
+            if json_start >= 0 and json_end > json_start:
+                json_str = result_text[json_start:json_end]
+                parsed = json.loads(json_str)
+
+                if parsed.get("compliant", False):
                     return {
-                        "compliant": False,
-                        "reason": parsed.get("reason", "Policy compliance check failed"),
-                        "notes": parsed.get("notes", result_text),
-                        "missing_information": parsed.get("missing_information", []),
+                        "compliant": True,
+                        "notes": parsed.get("notes", "Application complies with all policies"),
                     }
-            except (json.JSONDecodeError, ValueError):
-                # Fallback to text parsing
-                logger.warning("Could not parse JSON response, using text parsing")
-
-            # Fallback text parsing
-            if "true" in result_text.lower() and '"compliant": true' in result_text:
+                # Not compliant - return detailed information
                 return {
-                    "compliant": True,
-                    "notes": "Application complies with all policies",
+                    "compliant": False,
+                    "reason": parsed.get("reason", "Policy compliance check failed"),
+                    "notes": parsed.get("notes", result_text),
+                    "missing_information": parsed.get("missing_information", []),
                 }
+        except (json.JSONDecodeError, ValueError):
+            # Fallback to text parsing
+            logger.warning("Could not parse JSON response, using text parsing")
 
-            # Extract reason from response
-            reason = "Policy compliance check failed"
-            missing_info = []
-
-            if '"reason"' in result_text:
-                try:
-                    parts = result_text.split('"reason"')[1].split('"')
-                    if len(parts) > 1:
-                        reason = parts[1]
-                except IndexError:
-                    pass
-
-            if '"missing_information"' in result_text:
-                try:
-                    # Extract the array portion
-                    parts_str = result_text.split('"missing_information"')[1]
-                    array_start = parts_str.find("[")
-                    array_end = parts_str.find("]") + 1
-                    if array_start >= 0 and array_end > array_start:
-                        array_str = parts_str[array_start:array_end]
-                        missing_info = json.loads(array_str)
-                except (IndexError, json.JSONDecodeError):
-                    pass
-
+        # Fallback text parsing
+        if "true" in result_text.lower() and '"compliant": true' in result_text:
             return {
-                "compliant": False,
-                "reason": reason,
-                "notes": result_text,  # Return full text, not truncated
-                "missing_information": missing_info,
+                "compliant": True,
+                "notes": "Application complies with all policies",
             }
 
-        except Exception:
-            logger.exception("Error in policy compliance check")
-            # Re-raise the exception instead of silently returning compliant
-            raise
+        # Extract reason from response
+        reason = "Policy compliance check failed"
+        missing_info = []
+
+        if '"reason"' in result_text:
+            try:
+                parts = result_text.split('"reason"')[1].split('"')
+                if len(parts) > 1:
+                    reason = parts[1]
+            except IndexError:
+                pass
+
+        if '"missing_information"' in result_text:
+            try:
+                # Extract the array portion
+                parts_str = result_text.split('"missing_information"')[1]
+                array_start = parts_str.find("[")
+                array_end = parts_str.find("]") + 1
+                if array_start >= 0 and array_end > array_start:
+                    array_str = parts_str[array_start:array_end]
+                    missing_info = json.loads(array_str)
+            except (IndexError, json.JSONDecodeError):
+                pass
+
+        return {
+            "compliant": False,
+            "reason": reason,
+            "notes": result_text,  # Return full text, not truncated
+            "missing_information": missing_info,
+        }
@@ -1,25 +1,37 @@
 """Unit tests for loan approval agent."""
 
-from datetime import date
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
-from agents.loan_approval.src.agent import LoanApprovalAgent
+from agents.loan_approval.src import api
+from agents.loan_approval.src.agent import AgentState, LoanApprovalAgent, _amortized_payment
 from agents.loan_approval.src.config import AgentConfig
-from agents.loan_approval.src.tools import RiskCalculator
+from agents.loan_approval.src.tools import PolicyChecker, RiskCalculator, _policy_excerpt
 from shared.models.loan import (
     ApplicantInfo,
     CreditHistory,
+    DecisionType,
     EmploymentInfo,
     EmploymentStatus,
     FinancialInfo,
+    LoanDecision,
     LoanDetails,
+    LoanOutcome,
     LoanPurpose,
     LoanRequest,
 )
+from shared.monitoring import MetricsTracker, metrics
+from shared.utils import Permission, SecurityContext
 
 
 @pytest.fixture
@@ -74,9 +86,9 @@ def sample_loan_request() -> LoanRequest:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config() -> AgentConfig:
-    """Create test configuration."""
+    """Create test configuration (shared by the module, so tests must not mutate it)."""
     return AgentConfig(
         openai_api_key="test-key",
         environment="test",
@@ -84,12 +96,27 @@ def config() -> AgentConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def risk_calculator(config: AgentConfig) -> RiskCalculator:
     """Create risk calculator instance."""
     return RiskCalculator(config)
 
 
+@pytest.fixture
+def agent(config: AgentConfig) -> Iterator[LoanApprovalAgent]:
+    """Create a loan approval agent with a mocked LLM and policy documents."""
+    agent_config = config.model_copy(
+        update={"openai_api_key": "test-key-123", "enable_llm_logging": False}
+    )
+    with (
+        patch("agents.loan_approval.src.agent.config", agent_config),
+        patch("agents.loan_approval.src.agent.ChatOpenAI"),
+        patch("agents.loan_approval.src.agent.PDFLoader") as mock_pdf_loader,
+    ):
+        mock_pdf_loader.load_directory.return_value = "mock policy content"
+        yield LoanApprovalAgent(metrics_tracker=MagicMock())
+
+
 class TestRiskCalculator:
     """Tests for risk calculator."""
 
@@ -170,6 +197,30 @@ class TestRiskCalculator:
 
         assert 0 <= risk_score <= 100
 
+    def test_batch_matches_scalar_scores(
+        self, risk_calculator: RiskCalculator, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that batch scoring agrees with the per-request calculation."""
+        risky = sample_loan_request.model_copy(deep=True)
+        risky.credit_history.credit_score = 590
+        risky.credit_history.credit_utilization = Decimal(85)
+        risky.credit_history.number_of_late_payments_12m = 3
+        risky.employment.years_employed = None
+        risky.financial.has_foreclosure = True
+        risky.financial.foreclosure_date = date(2023, 1, 1)
+        no_property = sample_loan_request.model_copy(deep=True)
+        no_property.loan_details.property_value = None
+        requests = [sample_loan_request, risky, no_property]
+        dti_ratios = [0.20, 0.42, 0.31]
+
+        scores = risk_calculator.calculate_risk_scores_batch(requests, dti_ratios)
+
+        expected = [
+            risk_calculator.calculate_risk_score(request, dti)
+            for request, dti in zip(requests, dti_ratios, strict=True)
+        ]
+        assert scores.tolist() == expected
+
 
 class TestLoanRequestValidation:
     """Tests for loan request validation."""
@@ -297,6 +348,11 @@ class TestAgentHealthCheck:
         # Create agent
         agent = LoanApprovalAgent()
 
+        # The health check reports the workflow without building it
+        assert agent.health_check()["workflow_ready"] is False
+        assert "workflow" not in vars(agent)
+        _ = agent.workflow
+
         # Perform health check
         health_status = agent.health_check()
 
@@ -386,3 +442,541 @@ class TestAgentHealthCheck:
         # Verify health status shows error
         assert health_status["llm_responsive"] is False
         assert "LLM returned invalid response" in health_status["error"]
+
+
+@pytest.mark.unit
+class TestPolicyCache:
+    """Tests for the extracted policy text cache."""
+
+    @patch("agents.loan_approval.src.agent.PDFLoader")
+    def test_policies_reused_until_pdfs_change(self, mock_pdf_loader: MagicMock, tmp_path) -> None:
+        """Test that PDFs are only re-extracted when the directory contents change."""
+        mock_pdf_loader.load_directory.return_value = "policy text"
+        pdf_path = tmp_path / "policy.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+
+        agent = LoanApprovalAgent.__new__(LoanApprovalAgent)
+        agent.config = AgentConfig(policies_directory=str(tmp_path))
+
+        assert agent._load_policies() == "policy text"  # noqa: SLF001
+        assert agent._load_policies() == "policy text"  # noqa: SLF001
+        assert mock_pdf_loader.load_directory.call_count == 1
+
+        pdf_path.write_bytes(b"%PDF-1.4 updated")
+        assert agent._load_policies() == "policy text"  # noqa: SLF001
+        assert mock_pdf_loader.load_directory.call_count == 2
+
+
+@pytest.mark.unit
+class TestLazyWorkflow:
+    """Tests for building the workflow graph on first use."""
+
+    def test_workflow_built_once_on_first_use(self, agent: LoanApprovalAgent) -> None:
+        """Test that the workflow is not compiled at init and is reused once built."""
+        assert "workflow" not in vars(agent)
+
+        with patch.object(agent, "_build_workflow", return_value=MagicMock()) as mock_build:
+            first = agent.workflow
+            second = agent.workflow
+
+        assert first is second
+        mock_build.assert_called_once()
+
+
+@pytest.mark.unit
+class TestMetricsTracker:
+    """Tests for the MLflow metrics tracker."""
+
+    def test_worker_runs_register_one_exit_handler(self) -> None:
+        """Test that starting several worker runs registers mlflow.end_run at exit once."""
+        with (
+            patch.object(metrics, "mlflow") as mock_mlflow,
+            patch.object(metrics, "_end_run_registered", new=False),
+            patch.object(metrics.atexit, "register") as mock_register,
+        ):
+            mock_mlflow.active_run.return_value = None
+            for _ in range(3):
+                MetricsTracker(experiment_name="test").start_worker_run(run_name="worker")
+
+        mock_register.assert_called_once_with(mock_mlflow.end_run)
+
+
+@pytest.mark.unit
+class TestTracingSwitch:
+    """Tests for turning MLflow tracing off with ENABLE_TRACING."""
+
+    def test_agent_creation_leaves_tracing_alone(self, config: AgentConfig) -> None:
+        """Test that building an agent does not change process-wide tracing."""
+        agent_config = config.model_copy(
+            update={
+                "openai_api_key": "test-key-123",
+                "enable_llm_logging": False,
+                "enable_tracing": False,
+            }
+        )
+        with (
+            patch("agents.loan_approval.src.agent.config", agent_config),
+            patch("agents.loan_approval.src.agent.ChatOpenAI"),
+            patch("agents.loan_approval.src.agent.PDFLoader"),
+            patch("agents.loan_approval.src.agent.mlflow.tracing.disable") as mock_disable,
+        ):
+            LoanApprovalAgent(metrics_tracker=MagicMock())
+
+        mock_disable.assert_not_called()
+
+    def test_api_startup_disables_tracing(self, config: AgentConfig) -> None:
+        """Test that the API disables tracing once at startup when it is turned off."""
+        api_config = config.model_copy(update={"enable_tracing": False})
+        mock_agent = MagicMock()
+        mock_agent.health_check.return_value = {"llm_responsive": True}
+        with (
+            patch.object(api, "config", api_config),
+            patch.object(api, "LoanApprovalAgent", return_value=mock_agent),
+            patch.object(api.mlflow.tracing, "disable") as mock_disable,
+            TestClient(api.app),
+        ):
+            pass
+
+        mock_disable.assert_called_once_with()
+
+
+@pytest.mark.unit
+class TestCreateLLM:
+    """Tests for building the chat model client."""
+
+    def test_azure_default_api_version_accepts_max_completion_tokens(
+        self, agent: LoanApprovalAgent
+    ) -> None:
+        """Test that the default Azure API version supports the token cap sent to it."""
+        agent.config = AgentConfig(
+            use_azure_openai=True,
+            azure_openai_api_key="test-key",
+            azure_openai_endpoint="https://example.openai.azure.com/",
+        )
+
+        llm = agent._create_llm("test-deployment", None)  # noqa: SLF001
+        payload = llm._get_request_payload("OK")  # noqa: SLF001
+
+        assert payload["max_completion_tokens"] == agent.config.openai_max_tokens
+        # max_completion_tokens is accepted from 2024-09-01-preview onwards
+        assert llm.openai_api_version is not None
+        assert llm.openai_api_version >= "2024-09-01"
+
+
+@pytest.mark.unit
+class TestConcurrentProcessing:
+    """Tests for processing several requests at once."""
+
+    def test_requests_overlap_up_to_limit_and_keep_order(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that requests run concurrently, bounded, with outcomes in request order."""
+        requests = [
+            sample_loan_request.model_copy(update={"request_id": f"req-{i}"}) for i in range(6)
+        ]
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_process(request: LoanRequest) -> MagicMock:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return MagicMock(request_id=request.request_id)
+
+        with patch.object(agent, "process_loan_request", side_effect=fake_process):
+            outcomes = asyncio.run(agent.process_loan_requests(requests, max_concurrency=3))
+
+        assert [outcome.request_id for outcome in outcomes] == [r.request_id for r in requests]
+        assert 1 < peak <= 3
+
+    def test_failed_request_does_not_fail_batch(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that a request raising is returned as its exception, in place."""
+        requests = [
+            sample_loan_request.model_copy(update={"request_id": f"req-{i}"}) for i in range(3)
+        ]
+
+        def fake_process(request: LoanRequest) -> MagicMock:
+            if request.request_id == "req-1":
+                raise RuntimeError("LLM unavailable")
+            return MagicMock(request_id=request.request_id)
+
+        with patch.object(agent, "process_loan_request", side_effect=fake_process):
+            outcomes = asyncio.run(agent.process_loan_requests(requests))
+
+        assert isinstance(outcomes[1], RuntimeError)
+        assert [getattr(outcome, "request_id", None) for outcome in outcomes] == [
+            "req-0",
+            None,
+            "req-2",
+        ]
+
+
+@pytest.mark.unit
+class TestBatchEndpoint:
+    """Tests for the batch evaluation endpoint."""
+
+    def test_failed_item_is_returned_as_error_in_place(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that one failing application does not fail the rest of the batch."""
+        requests = [
+            sample_loan_request.model_copy(update={"request_id": f"req-{i}"}) for i in range(3)
+        ]
+        process_loan_request = agent.process_loan_request
+
+        def fake_process(request: LoanRequest) -> LoanOutcome:
+            if request.request_id == "req-1":
+                raise RuntimeError("LLM unavailable")
+            return process_loan_request(request)
+
+        with (
+            patch.object(api, "agent", agent),
+            patch.object(agent, "process_loan_request", side_effect=fake_process),
+        ):
+            response = TestClient(api.app).post(
+                "/api/v1/loan/evaluate_batch",
+                json=[request.model_dump(mode="json") for request in requests],
+            )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert [result["request_id"] for result in results] == ["req-0", "req-1", "req-2"]
+        assert "decision" in results[0]
+        assert "decision" in results[2]
+        assert results[1]["error"] == "Error processing loan request: LLM unavailable"
+
+
+@pytest.mark.unit
+class TestFastReject:
+    """Tests for rejecting applications before the workflow runs."""
+
+    def test_low_credit_score_skips_workflow(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that a credit score below the minimum is rejected without the workflow."""
+        sample_loan_request.credit_history.credit_score = 550
+        agent.workflow = MagicMock()
+
+        outcome = agent.process_loan_request(sample_loan_request)
+
+        assert outcome.decision.decision == DecisionType.DISAPPROVED
+        assert "Credit score 550" in (outcome.decision.disapproval_reason or "")
+        agent.workflow.invoke.assert_not_called()
+
+    def test_high_dti_skips_workflow(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that a DTI ratio above the maximum is rejected without the workflow."""
+        sample_loan_request.financial.monthly_debt_payments = Decimal(4000)
+        agent.workflow = MagicMock()
+
+        outcome = agent.process_loan_request(sample_loan_request)
+
+        assert outcome.decision.decision == DecisionType.DISAPPROVED
+        assert "Debt-to-income ratio" in (outcome.decision.disapproval_reason or "")
+        agent.workflow.invoke.assert_not_called()
+
+    def test_outcome_timestamp_is_decision_time(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that the outcome is stamped when the decision finishes, not when it started."""
+        decided_at: list[datetime] = []
+
+        def fake_fast_reject(_request: LoanRequest, _dti_ratio: float) -> LoanDecision:
+            time.sleep(0.01)
+            decided_at.append(datetime.now(tz=timezone.utc))
+            return LoanDecision(decision=DecisionType.DISAPPROVED, disapproval_reason="Test")
+
+        with patch.object(agent, "_fast_reject", side_effect=fake_fast_reject):
+            outcome = agent.process_loan_request(sample_loan_request)
+
+        assert outcome.timestamp >= decided_at[0]
+
+    def test_fast_reject_requires_permissions(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that rejecting without the workflow still enforces agent permissions."""
+        sample_loan_request.credit_history.credit_score = 550
+        agent.security_context = SecurityContext(
+            agent_id="limited-agent", permissions={Permission.READ_PII}
+        )
+
+        with pytest.raises(PermissionError, match="Permission denied"):
+            agent.process_loan_request(sample_loan_request)
+
+
+@pytest.mark.unit
+class TestFastLane:
+    """Tests for skipping the LLM policy check for low-risk applications."""
+
+    @pytest.fixture
+    def fast_lane_agent(self, agent: LoanApprovalAgent) -> LoanApprovalAgent:
+        """Agent with the fast lane enabled and a mocked compliance check."""
+        agent.config = agent.config.model_copy(update={"policy_check_skip_max_risk": 30})
+        agent._check_compliance = MagicMock(return_value={"compliant": True})  # noqa: SLF001
+        return agent
+
+    @pytest.fixture
+    def clean_request(self, sample_loan_request: LoanRequest) -> LoanRequest:
+        """Application passing every fast lane gate (LTV 0.75)."""
+        sample_loan_request.loan_details.property_value = Decimal(400000)
+        return sample_loan_request
+
+    def test_low_risk_skips_llm(
+        self, fast_lane_agent: LoanApprovalAgent, clean_request: LoanRequest
+    ) -> None:
+        """Test that a low-risk application passing every gate is decided without the LLM."""
+        state = fast_lane_agent._check_policies(  # noqa: SLF001
+            AgentState(request=clean_request, risk_score=30, dti_ratio=0.2)
+        )
+
+        fast_lane_agent._check_compliance.assert_not_called()  # noqa: SLF001
+        assert state.policy_compliant is True
+        fast_lane_agent.metrics_tracker.log_metrics.assert_called_once_with(  # type: ignore[attr-defined]
+            {"policy_fast_lane": 1.0}, synchronous=False
+        )
+
+    def test_risk_above_cutoff_uses_llm(
+        self, fast_lane_agent: LoanApprovalAgent, clean_request: LoanRequest
+    ) -> None:
+        """Test that a risk score above the cutoff is checked by the LLM."""
+        fast_lane_agent._check_policies(  # noqa: SLF001
+            AgentState(request=clean_request, risk_score=31, dti_ratio=0.2)
+        )
+
+        fast_lane_agent._check_compliance.assert_called_once()  # noqa: SLF001
+        fast_lane_agent.metrics_tracker.log_metrics.assert_called_once_with(  # type: ignore[attr-defined]
+            {"policy_fast_lane": 0.0}, synchronous=False
+        )
+
+    def test_derogatory_record_uses_llm(
+        self, fast_lane_agent: LoanApprovalAgent, clean_request: LoanRequest
+    ) -> None:
+        """Test that a bankruptcy on record is checked by the LLM, however low the risk."""
+        clean_request.financial.has_bankruptcy = True
+
+        fast_lane_agent._check_policies(  # noqa: SLF001
+            AgentState(request=clean_request, risk_score=10, dti_ratio=0.2)
+        )
+
+        fast_lane_agent._check_compliance.assert_called_once()  # noqa: SLF001
+
+    @pytest.mark.parametrize(
+        ("credit_score", "dti_ratio", "amount", "property_value"),
+        [
+            pytest.param(699, 0.2, 300000, 400000, id="credit_score"),
+            pytest.param(720, 0.34, 300000, 400000, id="dti"),
+            pytest.param(720, 0.30, 300000, 400000, id="dti_at_limit"),
+            pytest.param(720, 0.2, 2000000, 4000000, id="amount"),
+            pytest.param(720, 0.2, 300000, 315790, id="ltv"),
+            pytest.param(720, 0.2, 300000, None, id="no_property_value"),
+        ],
+    )
+    def test_failed_gate_uses_llm(  # noqa: PLR0913, PLR0917
+        self,
+        fast_lane_agent: LoanApprovalAgent,
+        clean_request: LoanRequest,
+        credit_score: int,
+        dti_ratio: float,
+        amount: int,
+        property_value: int | None,
+    ) -> None:
+        """Test that a low risk score alone does not skip the LLM past a failed gate."""
+        clean_request.credit_history.credit_score = credit_score
+        clean_request.loan_details.amount = Decimal(amount)
+        clean_request.loan_details.property_value = (
+            Decimal(property_value) if property_value else None
+        )
+
+        fast_lane_agent._check_policies(  # noqa: SLF001
+            AgentState(request=clean_request, risk_score=23, dti_ratio=dti_ratio)
+        )
+
+        fast_lane_agent._check_compliance.assert_called_once()  # noqa: SLF001
+
+
+@pytest.mark.unit
+class TestMissingPolicies:
+    """Tests for behavior when no policy documents are loaded."""
+
+    def test_policy_check_skips_llm(
+        self, agent: LoanApprovalAgent, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that the LLM is not called when there is no policy text."""
+        agent.policy_content = ""
+
+        state = agent._check_policies(AgentState(request=sample_loan_request))  # noqa: SLF001
+
+        assert state.policy_compliant is True
+        agent.llm.invoke.assert_not_called()
+
+    def test_require_policies_fails_init(self, config: AgentConfig) -> None:
+        """Test that agent creation fails when policies are required but missing."""
+        agent_config = config.model_copy(
+            update={
+                "openai_api_key": "test-key-123",
+                "enable_llm_logging": False,
+                "require_policies": True,
+            }
+        )
+        with (
+            patch("agents.loan_approval.src.agent.config", agent_config),
+            patch("agents.loan_approval.src.agent.ChatOpenAI"),
+            patch("agents.loan_approval.src.agent.PDFLoader") as mock_pdf_loader,
+        ):
+            mock_pdf_loader.load_directory.return_value = ""
+            with pytest.raises(ValueError, match="No policy documents"):
+                LoanApprovalAgent(metrics_tracker=MagicMock())
+
+
+@pytest.mark.unit
+class TestPolicyChecker:
+    """Tests for the LLM policy compliance checker."""
+
+    def test_identical_prompts_reuse_cached_result(self, sample_loan_request: LoanRequest) -> None:
+        """Test that a repeated application does not trigger a second LLM call."""
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = MagicMock(content='{"compliant": true, "notes": "OK"}')
+        checker = PolicyChecker(mock_llm, "policy content")
+
+        first = checker.check_compliance(sample_loan_request, 20)
+        first["compliant"] = False
+        second = checker.check_compliance(sample_loan_request, 20)
+        checker.check_compliance(sample_loan_request, 21)
+
+        assert second["compliant"] is True
+        assert mock_llm.invoke.call_count == 2
+
+    def test_cached_result_lists_are_not_shared(self, sample_loan_request: LoanRequest) -> None:
+        """Test that mutating a returned result does not change the cached answer."""
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = MagicMock(
+            content='{"compliant": false, "reason": "Missing", "missing_information": ["W-2"]}'
+        )
+        checker = PolicyChecker(mock_llm, "policy content")
+
+        first = checker.check_compliance(sample_loan_request, 20)
+        first["missing_information"].append("pay stub")
+        second = checker.check_compliance(sample_loan_request, 20)
+
+        assert second["missing_information"] == ["W-2"]
+        assert mock_llm.invoke.call_count == 1
+
+    def test_cache_evicts_least_recently_used(self, sample_loan_request: LoanRequest) -> None:
+        """Test that the cache keeps at most cache_size answers, dropping the oldest."""
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = MagicMock(content='{"compliant": true, "notes": "OK"}')
+        checker = PolicyChecker(mock_llm, "policy content", cache_size=2)
+
+        for risk_score in (10, 20, 10, 30, 10, 20):
+            checker.check_compliance(sample_loan_request, risk_score)
+
+        # 20 was evicted by 30, while 10 stayed recently used
+        assert mock_llm.invoke.call_count == 4
+
+    def test_checker_is_freed_without_garbage_collection(self) -> None:
+        """Test that the cache does not make the checker reference itself."""
+        checker = PolicyChecker(MagicMock(), "policy content")
+        ref = weakref.ref(checker)
+
+        del checker
+
+        assert ref() is None
+
+    def test_policy_excerpt_keeps_every_document(self) -> None:
+        """Test that the prompt budget is shared by all documents instead of the first one."""
+        short_doc = "=== Document: short.pdf ===\n\n" + "s" * 100
+        long_docs = [f"=== Document: long{i}.pdf ===\n\n" + "x" * 5000 for i in range(2)]
+        content = "\n\n" + "=" * 80 + "\n\n".join([long_docs[0], short_doc, long_docs[1]])
+
+        excerpt = _policy_excerpt(content, 1000)
+
+        assert len(excerpt) <= 1010
+        assert excerpt.index("long0.pdf") < excerpt.index("short.pdf") < excerpt.index("long1.pdf")
+        assert "s" * 100 in excerpt
+
+    def test_json_mode_binds_response_format(self, sample_loan_request: LoanRequest) -> None:
+        """Test that JSON mode requests json_object responses for compliance checks only."""
+        mock_llm = MagicMock()
+        bound_llm = mock_llm.bind.return_value
+        bound_llm.invoke.return_value = MagicMock(content='{"compliant": true, "notes": "OK"}')
+        checker = PolicyChecker(mock_llm, "policy content", json_mode=True)
+
+        result = checker.check_compliance(sample_loan_request, 20)
+
+        mock_llm.bind.assert_called_once_with(response_format={"type": "json_object"})
+        mock_llm.invoke.assert_not_called()
+        assert result["compliant"] is True
+
+    def test_screening_model_final_only_for_confident_verdicts(
+        self, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that confident screening verdicts skip the main model and others escalate."""
+        screening_answers = [
+            '{"compliant": false, "reason": "LTV too high", "confidence": 0.9}',
+            '{"compliant": true, "notes": "All good", "confidence": 0.99}',
+            '{"compliant": false, "reason": "LTV too high", "confidence": 0.5}',
+            '{"compliant": true, "notes": "Probably fine", "confidence": 0.6}',
+            "I cannot tell",
+        ]
+        screening_llm = MagicMock()
+        screening_llm.invoke.side_effect = [MagicMock(content=a) for a in screening_answers]
+        main_llm = MagicMock()
+        main_llm.invoke.return_value = MagicMock(content='{"compliant": true, "notes": "OK"}')
+        metrics_tracker = MagicMock()
+        checker = PolicyChecker(
+            main_llm,
+            "policy content",
+            cache_size=0,
+            screening_llm=screening_llm,
+            metrics_tracker=metrics_tracker,
+        )
+
+        results = [checker.check_compliance(sample_loan_request, 20) for _ in screening_answers]
+
+        assert [result["compliant"] for result in results] == [False, True, True, True, True]
+        assert results[0]["reason"] == "LTV too high"
+        assert results[1]["notes"] == "All good"
+        assert main_llm.invoke.call_count == 3
+        assert '"confidence"' in screening_llm.invoke.call_args.args[0]
+        escalated = [
+            c.args[0]["policy_screening_escalated"] for c in metrics_tracker.log_metrics.mock_calls
+        ]
+        assert escalated == [0.0, 0.0, 1.0, 1.0, 1.0]
+
+    def test_confident_compliant_screening_skips_main_model(
+        self, sample_loan_request: LoanRequest
+    ) -> None:
+        """Test that the main model is not called when the screening model is sure it complies."""
+        screening_llm = MagicMock()
+        screening_llm.invoke.return_value = MagicMock(
+            content='{"compliant": true, "notes": "All good", "confidence": 0.95}'
+        )
+        main_llm = MagicMock()
+        checker = PolicyChecker(main_llm, "policy content", screening_llm=screening_llm)
+
+        result = checker.check_compliance(sample_loan_request, 20)
+
+        assert result["compliant"] is True
+        main_llm.invoke.assert_not_called()
+
+
+@pytest.mark.unit
+class TestAmortizedPayment:
+    """Tests for the monthly payment calculation."""
+
+    def test_standard_rate(self) -> None:
+        """Test the annuity formula against a known payment."""
+        payment = _amortized_payment(100000.0, 0.06 / 12, 360)
+        assert payment == pytest.approx(599.55, abs=0.01)
+
+    def test_zero_rate_splits_principal_evenly(self) -> None:
+        """Test that an interest-free loan does not divide by zero."""
+        assert _amortized_payment(12000.0, 0.0, 24) == pytest.approx(500.0)
@@ -7,6 +7,7 @@ from shared.models.loan import (
     FinancialInfo,
     LoanDecision,
     LoanDetails,
+    LoanEvaluationError,
     LoanOutcome,
     LoanRequest,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "FinancialInfo",
     "LoanDecision",
     "LoanDetails",
+    "LoanEvaluationError",
     "LoanOutcome",
     "LoanRequest",
 ]
@@ -253,3 +253,10 @@ class LoanOutcome(BaseModel):
             Decimal: lambda v: str(v),
         }
     )
+
+
+class LoanEvaluationError(BaseModel):
+    """Evaluation failure of one application in a batch."""
+
+    request_id: str
+    error: str
@@ -1,5 +1,6 @@
 """Metrics tracking with MLFlow integration."""
 
+import atexit
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -11,6 +12,17 @@ from shared.monitoring.logger import get_logger
 
 logger = get_logger(__name__)
 
+# mlflow.end_run is registered with atexit once per process, however many trackers start runs
+_end_run_registered = False
+
+
+def _register_end_run() -> None:
+    """End the active MLflow run at process exit, registering the handler only once."""
+    global _end_run_registered  # noqa: PLW0603
+    if not _end_run_registered:
+        atexit.register(mlflow.end_run)
+        _end_run_registered = True
+
 
 class MetricsTracker:
     """Track metrics and send to MLFlow and Databricks Mosaic AI."""
@@ -25,6 +37,7 @@ class MetricsTracker:
         """
         self.experiment_name = experiment_name
         self.run_name = run_name
+        self._worker_run_id: str | None = None
         self._setup_mlflow()
 
     def _setup_mlflow(self) -> None:
@@ -48,7 +61,8 @@ class MetricsTracker:
         """
         name = run_name or self.run_name
         try:
-            with mlflow.start_run(run_name=name):
+            # Nest under the worker run (or any other active run) instead of failing
+            with mlflow.start_run(run_name=name, nested=mlflow.active_run() is not None):
                 logger.info(f"Started MLFlow run: {name}")
                 yield
         except Exception:
@@ -57,6 +71,39 @@ class MetricsTracker:
         finally:
             logger.info(f"Ended MLFlow run: {name}")
 
+    def start_worker_run(self, run_name: str | None = None) -> None:
+        """Start a long-lived MLFlow run shared by everything this process logs.
+
+        Reuses the active run if there is one. The run is ended when the process exits,
+        so callers avoid paying the run creation round-trip for every unit of work.
+
+        Args:
+            run_name: Optional run name
+
+        """
+        active_run = mlflow.active_run()
+        if active_run is not None:
+            self._worker_run_id = active_run.info.run_id
+            return
+
+        name = run_name or self.run_name
+        try:
+            self._worker_run_id = mlflow.start_run(run_name=name).info.run_id
+            _register_end_run()
+            logger.info(f"Started MLFlow worker run: {name}")
+        except Exception as e:
+            logger.warning(f"Failed to start MLFlow worker run: {e}")
+
+    def _run_id(self) -> str | None:
+        """Run to log to: the calling thread's active run, falling back to the worker run.
+
+        MLflow tracks the active run per thread, so without the fallback metrics logged
+        from a thread pool would each open a stray run of their own.
+        """
+        if mlflow.active_run() is not None:
+            return None
+        return self._worker_run_id
+
     def log_metric(self, key: str, value: float, step: int | None = None) -> None:
         """Log a metric to MLFlow.
 
@@ -67,21 +114,25 @@ class MetricsTracker:
 
         """
         try:
-            mlflow.log_metric(key, value, step=step)
+            mlflow.log_metric(key, value, step=step, run_id=self._run_id())
             logger.debug(f"Logged metric: {key}={value}")
         except Exception as e:
             logger.warning(f"Failed to log metric {key}: {e}")
 
-    def log_metrics(self, metrics: dict[str, float], step: int | None = None) -> None:
+    def log_metrics(
+        self, metrics: dict[str, float], step: int | None = None, *, synchronous: bool = True
+    ) -> None:
         """Log multiple metrics to MLFlow.
 
         Args:
             metrics: Dictionary of metric names and values
             step: Optional step number
+            synchronous: Wait for the tracking store to record the metrics; when False they
+                are queued and written by MLflow's background logger
 
         """
         try:
-            mlflow.log_metrics(metrics, step=step)
+            mlflow.log_metrics(metrics, step=step, synchronous=synchronous, run_id=self._run_id())
             logger.debug(f"Logged {len(metrics)} metrics")
         except Exception as e:
             logger.warning(f"Failed to log metrics: {e}")
@@ -1,6 +1,6 @@
 """Shared utility functions."""
 
 from shared.utils.pdf_loader import PDFLoader
-from shared.utils.security import PermissionChecker, SecurityContext
+from shared.utils.security import Permission, PermissionChecker, SecurityContext
 
-__all__ = ["PDFLoader", "PermissionChecker", "SecurityContext"]
+__all__ = ["PDFLoader", "Permission", "PermissionChecker", "SecurityContext"]
@@ -1,5 +1,6 @@
 """PDF document loader for policy documents."""
 
+import io
 from pathlib import Path
 
 import PyPDF2
@@ -13,20 +14,8 @@ class PDFLoader:
     """Load and extract text from PDF documents."""
 
     @staticmethod
-    def load_pdf(file_path: str) -> str:
-        """Load text content from a PDF file.
-
-        Args:
-            file_path: Path to the PDF file
-
-        Returns:
-            Extracted text content
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            ValueError: If file is not a valid PDF
-
-        """
+    def _validate_pdf_path(file_path: str) -> Path:
+        """Check that a path points to an existing PDF file."""
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"PDF file not found: {file_path}")
@@ -34,27 +23,60 @@ class PDFLoader:
         if path.suffix.lower() != ".pdf":
             raise ValueError(f"File is not a PDF: {file_path}")
 
+        return path
+
+    @staticmethod
+    def _write_pdf_text(file_path: str, buffer: io.StringIO) -> None:
+        """Append the text of every page of a PDF to a buffer.
+
+        Pages are separated by blank lines. If the PDF cannot be read, anything written for
+        it is rolled back so the buffer only holds complete documents.
+        """
+        path = PDFLoader._validate_pdf_path(file_path)
+        start = buffer.tell()
+
         try:
             with path.open("rb") as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text_content = []
+                separator = ""
 
                 for page_num, page in enumerate(pdf_reader.pages):
                     try:
                         page_text = page.extract_text()
                         if page_text:
-                            text_content.append(page_text)
+                            buffer.write(separator)
+                            buffer.write(page_text)
+                            separator = "\n\n"
                     except Exception:
                         logger.warning(f"Failed to extract text from page {page_num}")
 
-                result = "\n\n".join(text_content)
                 logger.info(f"Loaded PDF: {file_path} ({len(pdf_reader.pages)} pages)")
-                return result
 
         except Exception:
+            buffer.seek(start)
+            buffer.truncate()
             logger.exception(f"Error loading PDF {file_path}")
             raise
 
+    @staticmethod
+    def load_pdf(file_path: str) -> str:
+        """Load text content from a PDF file.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            Extracted text content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not a valid PDF
+
+        """
+        buffer = io.StringIO()
+        PDFLoader._write_pdf_text(file_path, buffer)
+        return buffer.getvalue()
+
     @staticmethod
     def load_multiple_pdfs(file_paths: list[str]) -> str:
         """Load text content from multiple PDF files.
@@ -66,15 +88,22 @@ class PDFLoader:
             Combined text content from all PDFs
 
         """
-        all_content = []
+        # Stream every document into one buffer instead of joining per-document strings
+        buffer = io.StringIO()
+        buffer.write("\n\n" + "=" * 80)
+        separator = ""
         for file_path in file_paths:
+            start = buffer.tell()
             try:
-                content = PDFLoader.load_pdf(file_path)
-                all_content.append(f"=== Document: {Path(file_path).name} ===\n\n{content}")
+                buffer.write(f"{separator}=== Document: {Path(file_path).name} ===\n\n")
+                PDFLoader._write_pdf_text(file_path, buffer)
+                separator = "\n\n"
             except Exception:
+                buffer.seek(start)
+                buffer.truncate()
                 logger.exception(f"Failed to load {file_path}")
 
-        return "\n\n" + "=" * 80 + "\n\n".join(all_content)
+        return buffer.getvalue()
 
     @staticmethod
     def load_directory(directory_path: str, pattern: str = "*.pdf") -> str: